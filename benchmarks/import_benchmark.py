@@ -0,0 +1,49 @@
+"""Import-time budget for ``import pyspring`` (``-X importtime``).
+
+Exits non-zero when the cumulative import time exceeds the budget or when the
+optional HOCON machinery is imported eagerly.
+
+Usage: python -m benchmarks.import_benchmark [budget_ms]
+"""
+import subprocess
+import sys
+from typing import Dict
+
+LAZY_MODULES = ("pyhocon", "pyparsing")
+
+
+def measure() -> Dict[str, int]:
+    # cumulative microseconds per top-level-imported module
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pyspring"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        if not cumulative_us.strip().isdigit():
+            continue
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def main(budget_ms: float) -> int:
+    cumulative = measure()
+    total_ms = cumulative["pyspring"] / 1000
+    print(f"import pyspring: {total_ms:.1f} ms (budget {budget_ms:.1f} ms)")
+
+    eager = [name for name in LAZY_MODULES if name in cumulative]
+    if eager:
+        print(f"imported eagerly: {', '.join(eager)}")
+        return 1
+    if total_ms > budget_ms:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else 100.0))
@@ -0,0 +1,96 @@
+"""Container memory at 1k/5k configured components, after the trees are released.
+
+Parsing is measured too, and pyhocon is slow under tracemalloc (~10 ms per
+entry), so larger sizes are passed explicitly.
+
+Usage: python -m benchmarks.memory_benchmark [sizes...]
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+import inject
+import pyhocon  # noqa: F401  # keep the module import out of the measurements
+
+from pyspring.auto import AutoBinder
+from pyspring.conditions import Environment
+from pyspring.decorators import (ConfigurableComponent,
+                                 ConfigurableComponentData)
+from pyspring.lazy import LazyBindingTable
+from pyspring.scaner import (flatten_config_with_decorator_data,
+                             iter_config_with_decorator_data)
+
+
+@ConfigurableComponent()
+class BenchmarkComponent:
+    def __init__(self, val: int, name: str) -> None:
+        self.val = val
+        self.name = name
+
+
+def write_config(size: int, folder: str) -> str:
+    config_path = os.path.join(folder, f"components_{size}.conf")
+    with open(config_path, "w") as f:
+        f.write("[\n")
+        for i in range(size):
+            f.write(
+                f"{{class: BenchmarkComponent, key: c{i}, val: {i}, name: n{i}, "
+                + "scope: prototype}\n"
+            )
+        f.write("]\n")
+    return config_path
+
+
+def measure(size: int, config_path: str, lazy: bool) -> None:
+    template = ConfigurableComponentData.from_cls(BenchmarkComponent)
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    environment = Environment(config_paths=[config_path])
+    binder = inject.Binder()
+    if lazy:
+        table = LazyBindingTable(
+            iter_config_with_decorator_data(
+                [template], [config_path], environment=environment
+            )
+        )
+        flattened = tracemalloc.get_traced_memory()[0]
+        AutoBinder([], lazy_binding_table=table).auto_bind(binder)
+        del table
+    else:
+        data_list = flatten_config_with_decorator_data(
+            [template], [config_path], environment=environment
+        )
+        flattened = tracemalloc.get_traced_memory()[0]
+        AutoBinder(data_list).auto_bind(binder)  # type: ignore
+        del data_list
+    # as auto_config does once bound
+    environment.release()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+
+    print(
+        f"{'lazy' if lazy else 'eager':<6}{size:>7} components: flattened={flattened / 2**20:8.1f} MiB "
+        + f"bound={current / 2**20:8.1f} MiB peak={peak / 2**20:8.1f} MiB "
+        + f"({current / size:6.0f} B/component, {elapsed:.1f}s)"
+    )
+    del binder
+
+
+def main(sizes: List[int]) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            config_path = write_config(size, folder)
+            measure(size, config_path, lazy=False)
+            measure(size, config_path, lazy=True)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 5_000])
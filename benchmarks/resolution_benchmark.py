@@ -0,0 +1,45 @@
+"""Resolution cost of the holder path vs. the compiled provider path.
+
+Usage: python -m benchmarks.resolution_benchmark [number]
+"""
+import sys
+import timeit
+from typing import Any, List
+
+import inject
+
+from pyspring import auto_config
+
+KEYS: List[Any] = [
+    "first",  # configured singleton
+    "second",  # configured prototype
+    "bean",  # @Bean on a @Configuration
+    "current_time",  # prototype function bean
+    "component1",  # prototype component
+]
+
+
+def run(compiled: bool, number: int) -> List[float]:
+    auto_config(
+        path="pyspring/examples",
+        config_path="pyspring/examples/example.hocon.conf",
+        compiled=compiled,
+    )
+    results = []
+    for key in KEYS:
+        inject.instance(key)
+        seconds = timeit.timeit(lambda: inject.instance(key), number=number)
+        results.append(seconds / number * 1e9)
+    return results
+
+
+def main(number: int) -> None:
+    holder = run(False, number)
+    compiled = run(True, number)
+    print(f"{'key':<14}{'holder ns':>12}{'compiled ns':>14}{'speedup':>10}")
+    for key, h, c in zip(KEYS, holder, compiled):
+        print(f"{key:<14}{h:>12.0f}{c:>14.0f}{h / c:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
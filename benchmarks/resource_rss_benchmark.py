@@ -0,0 +1,104 @@
+"""Per-worker memory of a large read-only table, read into the heap vs mapped.
+
+Every worker process builds the same configured component from a data file
+and touches all of its pages. Read into the heap, each worker holds a private
+copy (RssAnon); declared as ``resource: {path, format: raw}`` the pages come
+from the shared page cache (RssFile) and the proportional share (Pss) drops
+with the number of workers.
+
+Usage: python -m benchmarks.resource_rss_benchmark [workers] [size_mib]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+from typing import Any, Dict
+
+import inject
+
+from pyspring import ConfigurableComponent, auto_config
+
+
+@ConfigurableComponent()
+class LookupTable:
+    def __init__(self, data: Any) -> None:
+        # a plain path is read into the heap, a mapped resource is used as is
+        if isinstance(data, str):
+            with open(data, "rb") as f:
+                data = f.read()
+        self.data = data
+
+    def touch(self) -> int:
+        return sum(self.data[i] for i in range(0, len(self.data), 4096))
+
+
+def memory_kib() -> Dict[str, int]:
+    values: Dict[str, int] = {}
+    for name in ("/proc/self/status", "/proc/self/smaps_rollup"):
+        try:
+            with open(name) as f:
+                for line in f:
+                    field, _, rest = line.partition(":")
+                    if field in ("RssAnon", "RssFile", "Pss"):
+                        values[field] = int(rest.split()[0])
+        except OSError:
+            pass
+    return values
+
+
+def worker(
+    config_path: str, barrier: Any, results: "multiprocessing.Queue[Any]"
+) -> None:
+    auto_config(packages=[__name__], config_path=config_path)
+    inject.instance("table").touch()
+    # measure while every worker holds its table, so Pss shows the sharing
+    barrier.wait()
+    results.put(memory_kib())
+    barrier.wait()
+
+
+def run(workers: int, config_path: str) -> Dict[str, float]:
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(config_path, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    measurements = [results.get() for _ in range(workers)]
+    for process in processes:
+        process.join()
+    return {
+        field: sum(m.get(field, 0) for m in measurements) / workers / 1024
+        for field in ("RssAnon", "RssFile", "Pss")
+    }
+
+
+def main(workers: int, size_mib: int) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        data_path = os.path.join(folder, "table.bin")
+        with open(data_path, "wb") as f:
+            f.write(os.urandom(size_mib << 20))
+        configs = {
+            "heap": f'{{class: LookupTable, key: table, data: "{data_path}"}}',
+            "mapped": "{class: LookupTable, key: table, "
+            + f'data: {{resource: {{path: "{data_path}", format: raw}}}}}}',
+        }
+        print(f"{workers} workers, {size_mib} MiB table, MiB per worker:")
+        print(f"{'':>8}{'RssAnon':>10}{'RssFile':>10}{'Pss':>10}")
+        for name, entry in configs.items():
+            config_path = os.path.join(folder, f"{name}.conf")
+            with open(config_path, "w") as f:
+                f.write(f"[{entry}]\n")
+            memory = run(workers, config_path)
+            print(
+                f"{name:>8}{memory['RssAnon']:>10.1f}{memory['RssFile']:>10.1f}"
+                + f"{memory['Pss']:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else 8, args[1] if len(args) > 1 else 64)
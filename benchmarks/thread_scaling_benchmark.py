@@ -0,0 +1,88 @@
+"""Throughput of mixed-scope resolution from 1 to 64 threads.
+
+Every thread resolves the same keys in a loop; singleton identity is checked
+across all threads, so the run doubles as a stress test of the holder paths.
+On a GIL build throughput stays flat, on a free-threaded build (3.13t) it
+should scale with cores.
+
+Usage: python -m benchmarks.thread_scaling_benchmark [number] [--compiled]
+"""
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Set
+
+import inject
+
+from pyspring import auto_config
+
+KEYS: List[Any] = [
+    "first",  # configured singleton
+    "second",  # configured prototype
+    "bean",  # @Bean on a @Configuration
+    "current_time",  # prototype function bean
+    "component1",  # prototype component
+]
+SINGLETON_KEYS: List[Any] = ["first", "bean"]
+THREAD_COUNTS = [1, 2, 4, 8, 16, 32, 64]
+
+
+def worker(
+    number: int, barrier: threading.Barrier, seen: Dict[Any, Set[int]]
+) -> None:
+    ids: Dict[Any, Set[int]] = {key: set() for key in SINGLETON_KEYS}
+    barrier.wait()
+    for _ in range(number):
+        for key in KEYS:
+            instance = inject.instance(key)
+            if key in ids:
+                ids[key].add(id(instance))
+    for key, key_ids in ids.items():
+        seen[key].update(key_ids)
+
+
+def run(thread_count: int, number: int, compiled: bool) -> float:
+    # a fresh container per run, so first resolutions race as well
+    auto_config(
+        path="pyspring/examples",
+        config_path="pyspring/examples/example.hocon.conf",
+        compiled=compiled,
+    )
+    seen: Dict[Any, Set[int]] = {key: set() for key in SINGLETON_KEYS}
+    barrier = threading.Barrier(thread_count + 1)
+    threads = [
+        threading.Thread(target=worker, args=(number, barrier, seen))
+        for _ in range(thread_count)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    for key, key_ids in seen.items():
+        if len(key_ids) != 1:
+            raise AssertionError(f"singleton {key!r} was built {len(key_ids)} times")
+    return thread_count * number * len(KEYS) / seconds
+
+
+def main(number: int, compiled: bool) -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, gil enabled: {is_gil_enabled}")
+    print(f"{'threads':>8}{'ops/s':>14}{'ops/s/thread':>14}{'scaling':>10}")
+    baseline = None
+    for thread_count in THREAD_COUNTS:
+        throughput = run(thread_count, number, compiled)
+        if baseline is None:
+            baseline = throughput
+        print(
+            f"{thread_count:>8}{throughput:>14.0f}"
+            + f"{throughput / thread_count:>14.0f}{throughput / baseline:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    main(int(args[0]) if args else 2_000, "--compiled" in sys.argv)
@@ -1,20 +1,42 @@
+from concurrent.futures import Executor
 from typing import List, Optional
 
 import inject
 
 from pyspring.auto import AutoBinder  # noqa: F401
-from pyspring.decorators import Component  # noqa: F401
+from pyspring.background import BackgroundInitializer  # noqa: F401
+from pyspring.cache import BeanCache, CacheOptions, CachePolicy  # noqa: F401
+from pyspring.compiled import CompiledAutoBinder  # noqa: F401
+from pyspring.conditions import ConditionalOnConfig, Environment  # noqa: F401
+from pyspring.container import Container, OverrideLayer  # noqa: F401
 from pyspring.decorators import ConfigurableComponent  # noqa: F401
 from pyspring.decorators import Configuration  # noqa: F401
 from pyspring.decorators import Prototype  # noqa: F401
-from pyspring.decorators import Bean, FunctionNameBean, Singleton  # noqa: F401
-from pyspring.factory_model import BaseFactory  # noqa: F401
+from pyspring.decorators import (Bean, Cached, Component,  # noqa: F401
+                                 FunctionNameBean, Singleton)
 from pyspring.factory_model import BaseParser  # noqa: F401
 from pyspring.factory_model import BaseParserProvider  # noqa: F401
-from pyspring.injector import EnhancementInjector  # noqa: F401
-from pyspring.registry import BaseRegistry, InjectedRegistry  # noqa: F401
+from pyspring.factory_model import BaseBatchParser, BaseFactory  # noqa: F401
+from pyspring.injector import EnhancementInjector, try_instance  # noqa: F401
+from pyspring.lazy import LazyBindingTable  # noqa: F401
+from pyspring.locks import CircularDependencyError, DeadlockError  # noqa: F401
+from pyspring.partition import PartitionedContainer  # noqa: F401
+from pyspring.persist import (BaseCodec, PersistOptions,  # noqa: F401
+                              PickleCodec)
+from pyspring.proxy import LazyProxy, inject_lazy  # noqa: F401
+from pyspring.registry import (BaseRegistry, InjectedRegistry,  # noqa: F401
+                               inject_all, inject_all_attr, inject_map,
+                               inject_map_attr)
+from pyspring.resource import ResourceRef, load_resource  # noqa: F401
 from pyspring.scaner import auto_scan  # noqa: F401
-from pyspring.scope import Scope  # noqa: F401
+from pyspring.scaner import (flatten_config_with_decorator_data,
+                             iter_config_with_decorator_data, merge_paths,
+                             scan_all,
+                             split_configurable_component_scan_results)
+from pyspring.scope import InitMode, Scope  # noqa: F401
+from pyspring.soft import PartitionKey, SoftRegistry  # noqa: F401
+from pyspring.watchdog import InitWatchdog  # noqa: F401
+from pyspring.watchdog import InitBudget, InitTimeoutError  # noqa: F401
 
 
 def auto_config(
@@ -23,11 +45,84 @@ def auto_config(
     paths: Optional[List[str]] = None,
     config_path: Optional[str] = None,
     config_paths: Optional[List[str]] = None,
-) -> None:
-    scan_results = auto_scan(path, paths, config_path, config_paths)
-    auto_binder = AutoBinder(scan_results)
+    compiled: bool = False,
+    packages: Optional[List[str]] = None,
+    entry_point_group: Optional[str] = None,
+    lazy: bool = False,
+    lazy_max_holders: Optional[int] = None,
+    parser_executor: Optional[Executor] = None,
+    parser_batch_size: Optional[int] = None,
+    config_workers: Optional[int] = None,
+    soft_idle_ttl: Optional[float] = None,
+    soft_memory_budget: Optional[int] = None,
+    init_executor: Optional[Executor] = None,
+    profiles: Optional[List[str]] = None,
+    init_watchdog: Optional[InitWatchdog] = None,
+) -> Container:
+    """Scan, bind and install the container, returning a handle to change it.
 
+    Calling it again replaces every binding; use ``Container.register`` /
+    ``extend`` to add beans to the installed container instead.
+    """
+    lazy_binding_table: Optional[LazyBindingTable] = None
+    _config_paths = merge_paths(config_path, config_paths)
+    environment = Environment(profiles, _config_paths, config_workers)
+    (
+        configurable_component_scan_results,
+        scan_results,
+    ) = split_configurable_component_scan_results(
+        scan_all(path, paths, packages, entry_point_group, environment)
+    )
+    if lazy:
+        lazy_binding_table = LazyBindingTable(
+            iter_config_with_decorator_data(
+                configurable_component_scan_results,
+                _config_paths,
+                config_workers,
+                environment,
+            ),
+            max_holders=lazy_max_holders,
+        )
+    else:
+        scan_results.extend(
+            flatten_config_with_decorator_data(
+                configurable_component_scan_results,
+                _config_paths,
+                config_workers,
+                environment,
+            )
+        )
+    auto_binder_cls = CompiledAutoBinder if compiled else AutoBinder
+    auto_binder = auto_binder_cls(
+        scan_results,
+        lazy_binding_table=lazy_binding_table,
+        parser_executor=parser_executor,
+        parser_batch_size=parser_batch_size,
+        soft_registry=SoftRegistry(
+            idle_ttl=soft_idle_ttl, memory_budget=soft_memory_budget
+        ),
+        background_initializer=BackgroundInitializer(init_executor),
+        init_watchdog=init_watchdog,
+    )
+
+    injector = EnhancementInjector(
+        auto_binder.auto_bind, bind_in_runtime=bind_in_runtime
+    )
+    container = Container(
+        auto_binder,
+        injector,
+        environment,
+        configurable_component_scan_results,
+        _config_paths,
+    )
     with inject._INJECTOR_LOCK:
-        inject._INJECTOR = EnhancementInjector(
-            auto_binder.auto_bind, bind_in_runtime=bind_in_runtime
+        inject._INJECTOR = injector
+    # kwargs are extracted, only lazy entries and parsers keep their subtrees
+    environment.release()
+    # constructors resolve their dependencies, so builds start once installed
+    auto_binder.background_initializer.start()
+    if init_watchdog is not None:
+        auto_binder.background_initializer.add_done_callback(
+            init_watchdog.log_summary
         )
+    return container
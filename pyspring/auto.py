@@ -1,24 +1,58 @@
 import inspect
+import logging
+import queue
 import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import Executor, Future
+from functools import partial
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional
 
 import inject
-from pyhocon import ConfigTree
 
+from pyspring.background import (BackgroundInitializer, PrefetchStats,
+                                 RefreshStats)
+from pyspring.cache import BeanCache, CacheOptions, MemoCache, freeze
 from pyspring.decorators import (BeanData, ComponentData,
                                  ConfigurableComponentData, ConfigurationData,
                                  DecoratorData)
-from pyspring.factory_model import BaseFactory, BaseParser, BaseParserProvider
+from pyspring.factory_model import (BaseBatchParser, BaseFactory, BaseParser,
+                                    BaseParserProvider)
+from pyspring.kwargs_plan import KwargsPlan
+from pyspring.lazy import LazyBindingTable
+from pyspring.locks import InitLock
+from pyspring.persist import PersistedInitFunc, PersistOptions
+from pyspring.proxy import LazyProxy
 from pyspring.registry import BindingKeyMap
-from pyspring.scope import Scope
+from pyspring.resource import ResourceInitFunc, has_resources
+from pyspring.scope import InitMode, Scope
+from pyspring.soft import PartitionKey, SoftRegistry, SoftStats
+from pyspring.watchdog import InitBudget, InitWatchdog, WatchedInitFunc
+
+if TYPE_CHECKING:
+    from pyhocon import ConfigTree
+
+logger = logging.getLogger("pyspring")
 
 
 class AttrInstanceInjector:
+    __slots__ = ("attr_key_map", "lazy_proxies", "binding_key_map")
+
     attr_key_map: Dict[str, Any]
+    # attrs configured with ``lazy: true``, the proxy shared while the key is stable
+    lazy_proxies: Dict[str, LazyProxy]
+    binding_key_map: Optional[BindingKeyMap]
+
+    def __init__(
+        self, config: "ConfigTree", binding_key_map: Optional[BindingKeyMap] = None
+    ) -> None:
+        from pyhocon import ConfigTree
 
-    def __init__(self, config: ConfigTree) -> None:
         self.attr_key_map = {}
+        self.lazy_proxies = {}
+        self.binding_key_map = binding_key_map
         for attr_name in config.keys():
             attr_config = config.get(attr_name)
             if not isinstance(attr_config, ConfigTree):
@@ -38,18 +72,48 @@ class AttrInstanceInjector:
             if _key is None:
                 raise Exception(f"attr_config {attr_config} is not configureed a key")
             self.attr_key_map[attr_name] = _key
+            if attr_config.get_bool("lazy", False):
+                self.lazy_proxies[attr_name] = LazyProxy(_key)
 
     def __call__(self, instance: Any) -> Any:
         instance_attrs = set(dir(instance))
         for attr_name, key in self.attr_key_map.items():
             if attr_name not in instance_attrs:
                 continue
-            setattr(instance, attr_name, inject.instance(key))
+            if attr_name in self.lazy_proxies:
+                setattr(instance, attr_name, self.lazy_proxy(attr_name))
+            else:
+                setattr(instance, attr_name, inject.instance(key))
         return instance
 
+    def spec(self) -> Hashable:
+        # the attr wiring is an input of the product, as its kwargs are
+        return (freeze(self.attr_key_map), frozenset(self.lazy_proxies))
+
+    def lazy_proxy(self, attr_name: str) -> LazyProxy:
+        # a proxy keeps the target it resolved first, so sharing it across
+        # products is only safe while the key resolves to the same instance
+        key = self.attr_key_map[attr_name]
+        if self.binding_key_map is not None and self.binding_key_map.is_stable(key):
+            return self.lazy_proxies[attr_name]
+        return LazyProxy(key)
+
+
+# shared by holders without args/kwargs, never mutated
+_EMPTY_ARGS: List[Any] = []
+_EMPTY_KWARGS: Dict[str, Any] = {}
+
+# marks a product that is not built yet, None is a valid product
+_UNSET: Any = object()
+
+# seconds, for Scope.refresh beans without a refresh_interval
+DEFAULT_REFRESH_INTERVAL = 60.0
+
 
 class Holder(ABC):
-    attr_instance_injector: Optional[AttrInstanceInjector] = None
+    __slots__ = ("attr_instance_injector",)
+
+    attr_instance_injector: Optional[AttrInstanceInjector]
 
     @abstractmethod
     def get(self) -> Any:
@@ -62,11 +126,12 @@ class Holder(ABC):
 
 
 class InitFuncHolder(Holder):
+    __slots__ = ("init_func", "args", "kwargs", "cls_key")
+
     init_func: Callable[[], Any]
     args: List[Any]
     kwargs: Dict[str, Any]
-    cls_key: Optional[Any] = None
-    attr_instance_injector: Optional[AttrInstanceInjector] = None
+    cls_key: Optional[Any]
 
     def __init__(
         self,
@@ -77,103 +142,657 @@ class InitFuncHolder(Holder):
         attr_instance_injector: Optional[AttrInstanceInjector] = None,
     ) -> None:
         self.init_func = init_func
-        self.args = args if args is not None else []
-        self.kwargs = kwargs if kwargs is not None else {}
+        self.args = args if args is not None else _EMPTY_ARGS
+        self.kwargs = kwargs if kwargs is not None else _EMPTY_KWARGS
         self.cls_key = cls_key
         self.attr_instance_injector = attr_instance_injector
 
+    def create(self) -> Any:
+        if self.cls_key is not None:
+            cls_instance = inject.instance(self.cls_key)
+            _args = [cls_instance] + self.args
+            return self.init_func(*_args, **self.kwargs)
+        return self.init_func(*self.args, **self.kwargs)
+
 
 class SingletonHolder(InitFuncHolder):
-    singleton: Any = None
-    singleton_lock: threading.RLock = threading.RLock()
-
-    def init_singleton(self) -> None:
-        with self.singleton_lock:
-            if self.singleton is None:
-                if self.cls_key is not None:
-                    cls_instance = inject.instance(self.cls_key)
-                    _args = [cls_instance] + self.args
-                    self.singleton = self.init_func(*_args, **self.kwargs)
-                else:
-                    self.singleton = self.init_func(*self.args, **self.kwargs)
+    """Builds its product once.
+
+    The product is published with a single attribute store after it is fully
+    built, so ``get`` reads it without locking; only the first resolutions
+    contend on the holder's own lock.
+    """
+
+    __slots__ = ("singleton", "lock")
+
+    singleton: Any
+    lock: InitLock
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.singleton = _UNSET
+        self.lock = InitLock(getattr(self.init_func, "__qualname__", self.init_func))
+
+    def init_singleton(self) -> Any:
+        with self.lock:
+            singleton = self.singleton
+            if singleton is _UNSET:
+                singleton = self.create()
+                self.singleton = singleton
+            return singleton
+
+    def get(self) -> Any:
+        singleton = self.singleton
+        if singleton is _UNSET:
+            singleton = self.init_singleton()
+        if isinstance(singleton, BaseFactory):
+            return self.inject_instance(singleton.get())
+        return self.inject_instance(singleton)
+
+
+class BackgroundHolder(SingletonHolder):
+    """Singleton whose construction is submitted to an executor at startup."""
+
+    __slots__ = ("future",)
+
+    future: "Optional[Future[Any]]"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.future = None
+
+    def start(self, executor: Executor) -> None:
+        self.future = executor.submit(self.init_singleton)
+
+    def ready(self) -> bool:
+        return self.singleton is not _UNSET
+
+    def get(self) -> Any:
+        singleton = self.singleton
+        if singleton is _UNSET:
+            future = self.future
+            if future is not None and future.done() and not future.cancelled():
+                # re-raises the failure of the background build
+                singleton = future.result()
+            else:
+                # a running build is waited for on the holder lock, so waits on
+                # a worker are part of the deadlock detection; a build no
+                # worker picked up yet is not queued behind other builds
+                if future is not None:
+                    future.cancel()
+                singleton = self.init_singleton()
+        if isinstance(singleton, BaseFactory):
+            return self.inject_instance(singleton.get())
+        return self.inject_instance(singleton)
+
+
+class RefreshHolder(SingletonHolder):
+    """Singleton rebuilt in background once older than ``interval`` seconds.
+
+    The first resolution builds inline; after that readers always get the
+    current product without blocking, and a stale product is served while its
+    replacement is built. The replacement is swapped in with a single store; a
+    failed rebuild keeps the last good product and is retried an interval later.
+    """
+
+    __slots__ = (
+        "registry",
+        "interval",
+        "refreshed_at",
+        "refreshing",
+        "stats",
+        "state_lock",
+    )
+
+    registry: BackgroundInitializer
+    interval: float
+    refreshed_at: float
+    refreshing: bool
+    stats: RefreshStats
+
+    def __init__(
+        self,
+        init_func: Callable[[], Any],
+        registry: BackgroundInitializer,
+        interval: float,
+        kwargs: Optional[Dict[str, Any]] = None,
+        cls_key: Optional[Any] = None,
+        attr_instance_injector: Optional[AttrInstanceInjector] = None,
+    ) -> None:
+        super().__init__(
+            init_func,
+            kwargs=kwargs,
+            cls_key=cls_key,
+            attr_instance_injector=attr_instance_injector,
+        )
+        self.registry = registry
+        self.interval = interval
+        self.refreshed_at = 0.0
+        self.refreshing = False
+        self.stats = RefreshStats()
+        self.state_lock = threading.Lock()
+
+    def create(self) -> Any:
+        product = super().create()
+        self.refreshed_at = time.monotonic()
+        return product
+
+    def schedule_refresh(self, executor: Executor) -> None:
+        with self.state_lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+        executor.submit(self.refresh)
+
+    def refresh(self) -> None:
+        try:
+            self.singleton = self.create()
+            with self.state_lock:
+                self.stats.refreshes += 1
+        except Exception as e:
+            with self.state_lock:
+                self.stats.failures += 1
+                self.stats.last_error = e
+            # keep serving the last good product, retry an interval later
+            self.refreshed_at = time.monotonic()
+            logger.warning("refreshing %r failed", self.init_func, exc_info=True)
+        finally:
+            with self.state_lock:
+                self.refreshing = False
+
+    def get_stats(self) -> RefreshStats:
+        with self.state_lock:
+            return RefreshStats(
+                refreshes=self.stats.refreshes,
+                failures=self.stats.failures,
+                last_error=self.stats.last_error,
+            )
 
     def get(self) -> Any:
-        if self.singleton is None:
-            self.init_singleton()
-        if isinstance(self.singleton, BaseFactory):
-            return self.inject_instance(self.singleton.get())
-        return self.inject_instance(self.singleton)
+        singleton = self.singleton
+        if singleton is _UNSET:
+            singleton = self.init_singleton()
+        elif time.monotonic() - self.refreshed_at >= self.interval:
+            self.registry.refresh(self)
+        if isinstance(singleton, BaseFactory):
+            return self.inject_instance(singleton.get())
+        return self.inject_instance(singleton)
 
 
 class PrototypeHolder(InitFuncHolder):
+    __slots__ = ()
+
     def get(self) -> Any:
-        if self.cls_key is not None:
-            cls_instance = inject.instance(self.cls_key)
-            _args = [cls_instance] + self.args
-            instance_or_factory = self.init_func(*_args, **self.kwargs)
-        else:
-            instance_or_factory = self.init_func(*self.args, **self.kwargs)
-        instance_or_factory = self.inject_instance(instance_or_factory)
+        instance_or_factory = self.inject_instance(self.create())
         if isinstance(instance_or_factory, BaseFactory):
             return self.inject_instance(instance_or_factory.get())
         return instance_or_factory
 
 
+class PrefetchHolder(PrototypeHolder):
+    """Prototype served from a bounded queue of instances built in background.
+
+    Every instance is handed out once. ``get`` falls back to building inline
+    when the queue is empty, and schedules a refill either way.
+    """
+
+    __slots__ = ("registry", "queue", "refilling", "stats", "lock")
+
+    registry: BackgroundInitializer
+    queue: "queue.Queue[Any]"
+    refilling: bool
+    stats: PrefetchStats
+
+    def __init__(
+        self,
+        init_func: Callable[[], Any],
+        registry: BackgroundInitializer,
+        prefetch: int,
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        cls_key: Optional[Any] = None,
+        attr_instance_injector: Optional[AttrInstanceInjector] = None,
+    ) -> None:
+        super().__init__(
+            init_func,
+            args=args,
+            kwargs=kwargs,
+            cls_key=cls_key,
+            attr_instance_injector=attr_instance_injector,
+        )
+        self.registry = registry
+        self.queue = queue.Queue(maxsize=prefetch)
+        self.refilling = False
+        self.stats = PrefetchStats()
+        self.lock = threading.Lock()
+
+    def produce(self) -> Any:
+        return PrototypeHolder.get(self)
+
+    def schedule_refill(self, executor: Executor) -> None:
+        with self.lock:
+            if self.refilling or self.queue.full():
+                return
+            self.refilling = True
+        executor.submit(self.refill)
+
+    def refill(self) -> None:
+        try:
+            while not self.queue.full():
+                self.queue.put_nowait(self.produce())
+                with self.lock:
+                    self.stats.produced += 1
+        except queue.Full:
+            pass
+        except Exception:
+            with self.lock:
+                self.stats.failures += 1
+            # the next inline build raises it to the caller
+            logger.warning("prefetching %r failed", self.init_func, exc_info=True)
+        finally:
+            with self.lock:
+                self.refilling = False
+
+    def get_stats(self) -> PrefetchStats:
+        with self.lock:
+            return PrefetchStats(
+                hits=self.stats.hits,
+                misses=self.stats.misses,
+                produced=self.stats.produced,
+                failures=self.stats.failures,
+                depth=self.queue.qsize(),
+            )
+
+    def get(self) -> Any:
+        try:
+            instance = self.queue.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                self.stats.misses += 1
+            self.registry.refill(self)
+            return self.produce()
+        with self.lock:
+            self.stats.hits += 1
+        self.registry.refill(self)
+        return instance
+
+
+class CachedHolder(InitFuncHolder):
+    __slots__ = ("memo_cache", "params_key")
+
+    memo_cache: MemoCache
+    params_key: Hashable
+
+    def __init__(
+        self,
+        init_func: Callable[[], Any],
+        memo_cache: MemoCache,
+        params_key: Hashable,
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        cls_key: Optional[Any] = None,
+        attr_instance_injector: Optional[AttrInstanceInjector] = None,
+    ) -> None:
+        super().__init__(
+            init_func,
+            args=args,
+            kwargs=kwargs,
+            cls_key=cls_key,
+            attr_instance_injector=attr_instance_injector,
+        )
+        self.memo_cache = memo_cache
+        self.params_key = params_key
+
+    def create_injected(self) -> Any:
+        return self.inject_instance(self.create())
+
+    def get(self) -> Any:
+        instance_or_factory = self.memo_cache.get_or_create(
+            self.params_key, self.create_injected
+        )
+        if isinstance(instance_or_factory, BaseFactory):
+            return self.inject_instance(instance_or_factory.get())
+        return instance_or_factory
+
+
+class SoftHolder(InitFuncHolder):
+    __slots__ = ("registry", "instance", "binding_key", "last_used", "stats", "lock")
+
+    registry: SoftRegistry
+    instance: Any
+    binding_key: Any
+    last_used: float
+    stats: SoftStats
+    lock: InitLock
+
+    def __init__(
+        self,
+        init_func: Callable[[], Any],
+        registry: SoftRegistry,
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        cls_key: Optional[Any] = None,
+        attr_instance_injector: Optional[AttrInstanceInjector] = None,
+    ) -> None:
+        super().__init__(
+            init_func,
+            args=args,
+            kwargs=kwargs,
+            cls_key=cls_key,
+            attr_instance_injector=attr_instance_injector,
+        )
+        self.registry = registry
+        self.instance = _UNSET
+        self.binding_key = None
+        self.last_used = 0.0
+        self.stats = SoftStats()
+        self.lock = InitLock(getattr(self.init_func, "__qualname__", self.init_func))
+
+    def built(self) -> bool:
+        return self.instance is not _UNSET
+
+    def build(self) -> Any:
+        # user code runs under the holder's own lock, the registry lock only
+        # guards the bookkeeping
+        with self.lock:
+            instance = self.instance
+            if instance is not _UNSET:
+                return instance
+            instance = self.create()
+            with self.registry.lock:
+                if self.stats.builds:
+                    self.stats.rebuilds += 1
+                self.stats.builds += 1
+                self.instance = instance
+                self.last_used = time.monotonic()
+        self.registry.collect(keep=self)
+        return instance
+
+    def evict(self) -> int:
+        with self.registry.lock:
+            if self.instance is _UNSET:
+                return 0
+            self.instance = _UNSET
+            self.stats.evictions += 1
+            return 1
+
+    def get(self) -> Any:
+        # keep a local reference, the registry may evict concurrently
+        instance = self.instance
+        if instance is _UNSET:
+            instance = self.build()
+        self.registry.touch(self)
+        if isinstance(instance, BaseFactory):
+            return self.inject_instance(instance.get())
+        return self.inject_instance(instance)
+
+
+class ParserPool:
+    """Parser instances shared per parser class, each built under its own lock."""
+
+    parsers: Dict[type, BaseParser]
+    locks: Dict[type, InitLock]
+
+    def __init__(self) -> None:
+        self.parsers = {}
+        self.locks = {}
+        self.lock = threading.Lock()
+
+    def get(self, parser_cls: type, create: Callable[[], BaseParser]) -> BaseParser:
+        parser = self.parsers.get(parser_cls)
+        if parser is None:
+            with self.lock:
+                lock = self.locks.get(parser_cls)
+                if lock is None:
+                    lock = self.locks[parser_cls] = InitLock(
+                        getattr(parser_cls, "__qualname__", parser_cls)
+                    )
+            with lock:
+                parser = self.parsers.get(parser_cls)
+                if parser is None:
+                    parser = create()
+                    self.parsers[parser_cls] = parser
+        return parser
+
+
+def parse_each(parser: BaseParser, configs: List["ConfigTree"]) -> List[Any]:
+    return [parser.parse(config) for config in configs]
+
+
+# set on parser executor threads, nested batches parse inline instead of
+# waiting for a pool their own thread belongs to
+_PARSER_WORKER = threading.local()
+
+
+def parse_on_worker(
+    parse_many: Callable[[List[Any]], List[Any]], configs: List[Any]
+) -> List[Any]:
+    _PARSER_WORKER.active = True
+    try:
+        return parse_many(configs)
+    finally:
+        _PARSER_WORKER.active = False
+
+
+class ParserBatch:
+    """Singleton parser entries of one parser class, parsed together on first use.
+
+    The batch runs once and without holding a lock, so parsers may resolve
+    other parser-backed beans, from executor threads too. If it fails, its
+    entries are parsed one by one and each keeps its own error. Entries
+    resolved while the batch runs parse on their own; the first product
+    published wins. Holders are referenced weakly, so entries evicted from a
+    bounded lazy table or unbound leave the batch.
+    """
+
+    parser_cls: type
+    # id -> holder, in bind order
+    holders: "weakref.WeakValueDictionary[int, ParserHolder]"
+    executor: Optional[Executor]
+    batch_size: Optional[int]
+    done: bool
+
+    def __init__(
+        self,
+        parser_cls: type,
+        executor: Optional[Executor] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        self.parser_cls = parser_cls
+        self.holders = weakref.WeakValueDictionary()
+        self.executor = executor
+        self.batch_size = batch_size
+        self.done = False
+        self.lock = threading.Lock()
+
+    def add(self, holder: "ParserHolder") -> None:
+        with self.lock:
+            self.holders[id(holder)] = holder
+            holder.batch = self
+
+    def parse_all(self) -> None:
+        with self.lock:
+            if self.done:
+                return
+            self.done = True
+            pending = [
+                holder
+                for holder in list(self.holders.values())
+                if holder.singleton is _UNSET
+            ]
+        if not pending:
+            return
+        try:
+            results = self.parse_pending(pending)
+        except Exception as error:
+            logger.warning(
+                "batch parsing of %s failed, parsing its entries one by one: %r",
+                self.parser_cls.__qualname__,
+                error,
+            )
+            for holder in pending:
+                try:
+                    holder.init_singleton()
+                except Exception as holder_error:
+                    holder.error = holder_error
+            return
+        for holder, result in zip(pending, results):
+            holder.publish(result)
+
+    def parse_pending(self, pending: List["ParserHolder"]) -> List[Any]:
+        pending[0].init_parser()
+        parser = pending[0].parser_instance
+        assert parser is not None
+
+        configs = [holder.config for holder in pending]
+        batch_size = self.batch_size or len(configs)
+        chunks = [
+            configs[i:i + batch_size] for i in range(0, len(configs), batch_size)
+        ]
+        if isinstance(parser, BaseBatchParser):
+            parse_many: Callable[[List[Any]], List[Any]] = parser.parse_many
+        else:
+            parse_many = partial(parse_each, parser)
+        if self.executor is not None and not getattr(_PARSER_WORKER, "active", False):
+            results = list(
+                chain.from_iterable(
+                    self.executor.map(partial(parse_on_worker, parse_many), chunks)
+                )
+            )
+        else:
+            results = list(chain.from_iterable(map(parse_many, chunks)))
+
+        if len(results) != len(pending):
+            raise Exception(
+                f"{type(parser)} returned {len(results)} results "
+                + f"for {len(pending)} configs"
+            )
+        return results
+
+
 class ParserHolder(Holder):
+    __slots__ = (
+        "parser_cls",
+        "config",
+        "scope",
+        "parser_instance",
+        "singleton",
+        "memo_cache",
+        "params_key",
+        "parser_pool",
+        "batch",
+        "error",
+        "lock",
+        "__weakref__",
+    )
+
     parser_cls: type
-    config: ConfigTree
+    config: "ConfigTree"
     scope: Scope
 
-    parser_instance: Optional[BaseParser] = None
-    singleton: Optional[Any] = None
+    parser_instance: Optional[BaseParser]
+    singleton: Any
+    # failure of the batch fallback, raised by the next resolution only
+    error: Optional[Exception]
+    lock: InitLock
 
-    parser_lock: threading.RLock = threading.RLock()
+    memo_cache: Optional[MemoCache]
+    params_key: Optional[Hashable]
 
-    attr_instance_injector: Optional[AttrInstanceInjector] = None
+    parser_pool: Optional[ParserPool]
+    batch: Optional[ParserBatch]
 
     def __init__(
         self,
         parser_cls: type,
-        config: ConfigTree,
+        config: "ConfigTree",
         scope: Scope,
         attr_instance_injector: Optional[AttrInstanceInjector] = None,
+        memo_cache: Optional[MemoCache] = None,
+        params_key: Optional[Hashable] = None,
+        parser_pool: Optional[ParserPool] = None,
     ) -> None:
         self.parser_cls = parser_cls
         self.config = config
         self.scope = scope
         self.attr_instance_injector = attr_instance_injector
+        self.memo_cache = memo_cache
+        self.params_key = params_key
+        self.parser_instance = None
+        self.singleton = _UNSET
+        self.parser_pool = parser_pool
+        self.batch = None
+        self.error = None
+        self.lock = InitLock(getattr(parser_cls, "__qualname__", parser_cls))
+
+    def create_parser(self) -> BaseParser:
+        parser_or_provider = self.parser_cls()
+        if isinstance(parser_or_provider, BaseParserProvider):
+            parser_or_provider = self.inject_instance(parser_or_provider)
+            return self.inject_instance(parser_or_provider.get())
+        return parser_or_provider
 
     def init_parser(self) -> None:
-        with self.parser_lock:
+        if self.parser_pool is not None:
+            self.parser_instance = self.parser_pool.get(
+                self.parser_cls, self.create_parser
+            )
+            return
+        with self.lock:
             if self.parser_instance is None:
-                parser_or_provider = self.parser_cls()
-                if isinstance(parser_or_provider, BaseParserProvider):
-                    parser_or_provider = self.inject_instance(parser_or_provider)
-                    self.parser_instance = self.inject_instance(
-                        parser_or_provider.get()
-                    )
-                else:
-                    self.parser_instance = parser_or_provider
-
-    def init_singleton(self) -> None:
-        with self.parser_lock:
-            if self.singleton is None:
-                if self.parser_instance is None:
-                    self.init_parser()
+                self.parser_instance = self.create_parser()
+
+    def init_singleton(self) -> Any:
+        if self.batch is not None:
+            self.batch.parse_all()
+            singleton = self.singleton
+            if singleton is not _UNSET:
+                return singleton
+            error = self.error
+            if error is not None:
+                self.error = None
+                raise error
+        if self.parser_instance is None:
+            self.init_parser()
+        with self.lock:
+            if self.singleton is _UNSET:
                 assert self.parser_instance is not None
                 parser_instance = self.inject_instance(self.parser_instance)
                 _singleton = parser_instance.parse(self.config)
                 self.singleton = _singleton
+            return self.singleton
+
+    def publish(self, singleton: Any) -> None:
+        with self.lock:
+            if self.singleton is _UNSET:
+                self.singleton = singleton
+
+    def create_product(self) -> Any:
+        if self.parser_instance is None:
+            self.init_parser()
+        return self.parse()
+
+    def parse(self) -> Any:
+        assert self.parser_instance is not None
+        parser_instance = self.inject_instance(self.parser_instance)
+        return parser_instance.parse(self.config)
 
     def get(self) -> Any:
         if self.parser_instance is None:
             self.init_parser()
         if self.scope == Scope.singleton:
-            if self.singleton is None:
-                self.init_singleton()
-            if isinstance(self.singleton, BaseFactory):
-                return self.inject_instance(self.singleton.get())
-            return self.inject_instance(self.singleton)
+            singleton = self.singleton
+            if singleton is _UNSET:
+                singleton = self.init_singleton()
+            if isinstance(singleton, BaseFactory):
+                return self.inject_instance(singleton.get())
+            return self.inject_instance(singleton)
+        elif self.scope == Scope.cached:
+            assert self.memo_cache is not None
+            cached = self.memo_cache.get_or_create(self.params_key, self.parse)
+            if isinstance(cached, BaseFactory):
+                return self.inject_instance(cached.get())
+            return self.inject_instance(cached)
         else:
             assert self.parser_instance is not None
             parser_instance = self.inject_instance(self.parser_instance)
@@ -186,51 +805,316 @@ class ParserHolder(Holder):
 class AutoBinder:
     decorator_data_list: List[DecoratorData]
     binder: Optional[inject.Binder] = None
+    bean_cache: BeanCache
+    binding_key_map: BindingKeyMap
+    lazy_binding_table: Optional[LazyBindingTable]
+    parser_pool: ParserPool
+    parser_batches: Dict[type, ParserBatch]
+    parser_executor: Optional[Executor]
+    parser_batch_size: Optional[int]
+    soft_registry: SoftRegistry
+    background_initializer: BackgroundInitializer
+    init_watchdog: InitWatchdog
+    partition: Optional[str]
 
-    def __init__(self, decorator_data_list: List[DecoratorData]) -> None:
+    def __init__(
+        self,
+        decorator_data_list: List[DecoratorData],
+        binding_key_map: Optional[BindingKeyMap] = None,
+        lazy_binding_table: Optional[LazyBindingTable] = None,
+        parser_executor: Optional[Executor] = None,
+        parser_batch_size: Optional[int] = None,
+        soft_registry: Optional[SoftRegistry] = None,
+        background_initializer: Optional[BackgroundInitializer] = None,
+        init_watchdog: Optional[InitWatchdog] = None,
+        partition: Optional[str] = None,
+    ) -> None:
         self.decorator_data_list = decorator_data_list
+        self.partition = partition
+        self.bean_cache = BeanCache()
+        self.soft_registry = (
+            soft_registry if soft_registry is not None else SoftRegistry()
+        )
+        self.background_initializer = (
+            background_initializer
+            if background_initializer is not None
+            else BackgroundInitializer()
+        )
+        self.init_watchdog = (
+            init_watchdog if init_watchdog is not None else InitWatchdog()
+        )
+        self.binding_key_map = (
+            binding_key_map if binding_key_map is not None else BindingKeyMap()
+        )
+        self.lazy_binding_table = lazy_binding_table
+        self.parser_pool = ParserPool()
+        self.parser_batches = {}
+        self.parser_executor = parser_executor
+        self.parser_batch_size = parser_batch_size
 
     def auto_bind(self, binder: inject.Binder) -> None:
         self.binder = binder
 
+        self.bind_decorator_data_list(self.decorator_data_list)
+
+        if self.lazy_binding_table is not None:
+            self.bind_lazy_binding_table(self.lazy_binding_table)
+
+        binder.bind(BindingKeyMap, self.binding_key_map)
+        binder.bind(BeanCache, self.bean_cache)
+        binder.bind(SoftRegistry, self.soft_registry)
+        binder.bind(BackgroundInitializer, self.background_initializer)
+        binder.bind(InitWatchdog, self.init_watchdog)
+
+    def bind_decorator_data_list(
+        self, decorator_data_list: List[DecoratorData]
+    ) -> None:
         # deduplicate
         decorator_data_map: Dict[Any, DecoratorData] = {}
-        for decorator_data in self.decorator_data_list:
+        for decorator_data in decorator_data_list:
             decorator_data_map[decorator_data.get_key()] = decorator_data
 
-        binding_key_map = BindingKeyMap()
-
         for decorator_data in decorator_data_map.values():
-            if isinstance(decorator_data, ComponentData):
-                self.bind_component(decorator_data)
-            if isinstance(decorator_data, ConfigurationData):
-                self.bind_configuration(decorator_data)
-            if isinstance(decorator_data, BeanData):
-                self.bind_bean(decorator_data)
-            if isinstance(decorator_data, ConfigurableComponentData):
-                self.bind_configurable_component(decorator_data)
+            self.bind_decorator_data(decorator_data)
+
+    def bind_decorator_data(self, decorator_data: DecoratorData) -> None:
+        if isinstance(decorator_data, ComponentData):
+            self.bind_component(decorator_data)
+        if isinstance(decorator_data, ConfigurationData):
+            self.bind_configuration(decorator_data)
+        if isinstance(decorator_data, BeanData):
+            self.bind_bean(decorator_data)
+        if isinstance(decorator_data, ConfigurableComponentData):
+            self.bind_configurable_component(decorator_data)
+
+        key = decorator_data.get_key()
+        product_type = decorator_data.get_product_type()
+        self.binding_key_map.add(
+            product_type, key, stable=self.is_stable(decorator_data)
+        )
+
+    def bind_delta(
+        self, decorator_data_list: List[DecoratorData]
+    ) -> Dict[inject.Binding, inject.Provider]:
+        """Bind into a fresh binder, returning the bindings to publish.
+
+        Used once the injector is installed: existing holders are untouched and
+        only the indexes of the new keys are updated.
+        """
+        binder = self.binder
+        self.binder = inject.Binder()
+        try:
+            self.bind_decorator_data_list(decorator_data_list)
+            return self.binder._bindings
+        finally:
+            self.binder = binder
+
+    def unbind(self, key: Any) -> None:
+        self.binding_key_map.remove(key)
+        self.bean_cache.unregister(key)
+        self.soft_registry.unregister(self.soft_key(key))
+        self.background_initializer.unregister(key)
+        if self.lazy_binding_table is not None:
+            self.lazy_binding_table.remove(key)
+
+    def soft_key(self, key: Any) -> Any:
+        return key if self.partition is None else PartitionKey(self.partition, key)
+
+    def bind_lazy_binding_table(self, lazy_binding_table: LazyBindingTable) -> None:
+        assert self.binder is not None
+        lazy_binding_table.auto_binder = self
+        for key in lazy_binding_table.keys():
+            # configured entries override scanned ones, as in the eager dedup
+            self.binder._bindings[key] = lazy_binding_table.provider(key)
+            self.binding_key_map.add(
+                lazy_binding_table.get_product_type(key),
+                key,
+                # evicted holders are rebuilt, so their singletons may change
+                stable=lazy_binding_table.max_holders is None
+                and self.is_stable_scope(
+                    lazy_binding_table.get_scope(key),
+                    lazy_binding_table.entries[key][0].cls,
+                ),
+            )
+        self.binder.bind(LazyBindingTable, lazy_binding_table)
 
-            key = decorator_data.get_key()
-            product_type = decorator_data.get_product_type()
-            binding_key_map.add(product_type, key)
+    @staticmethod
+    def is_stable_scope(scope: Scope, init_func: Any) -> bool:
+        # singleton factories hand out a new product on every get
+        if inspect.isclass(init_func) and issubclass(init_func, BaseFactory):
+            return False
+        return scope == Scope.singleton
 
-        binder.bind(BindingKeyMap, binding_key_map)
+    def is_stable(self, decorator_data: DecoratorData) -> bool:
+        if isinstance(decorator_data, ConfigurationData):
+            return True
+        if isinstance(decorator_data, ComponentData):
+            return self.is_stable_scope(decorator_data.scope, decorator_data.cls)
+        if isinstance(decorator_data, BeanData):
+            return self.is_stable_scope(
+                decorator_data.scope, decorator_data.product_cls
+            )
+        if isinstance(decorator_data, ConfigurableComponentData):
+            return self.is_stable_scope(
+                decorator_data.get_scope(), decorator_data.cls
+            )
+        return False
 
     def bind_to_provider(self, cls: inject.Binding, provider: inject.Provider) -> None:
         assert self.binder is not None
         self.binder._check_class(cls)
         self.binder._bindings[cls] = provider
 
+    def get_parser_batch(self, parser_cls: type) -> ParserBatch:
+        parser_batch = self.parser_batches.get(parser_cls)
+        if parser_batch is None:
+            parser_batch = ParserBatch(
+                parser_cls,
+                executor=self.parser_executor,
+                batch_size=self.parser_batch_size,
+            )
+            self.parser_batches[parser_cls] = parser_batch
+        return parser_batch
+
+    def get_provider(self, holder: Holder) -> inject.Provider:
+        return holder.get
+
+    def create_holder(
+        self,
+        key: Any,
+        scope: Scope,
+        init_func: Callable[..., Any],
+        kwargs: Optional[Dict[str, Any]] = None,
+        cls_key: Optional[Any] = None,
+        attr_instance_injector: Optional[AttrInstanceInjector] = None,
+        cache: Optional[CacheOptions] = None,
+        persist: Optional[PersistOptions] = None,
+        init: InitMode = InitMode.lazy,
+        prefetch: int = 0,
+        init_timeout: Optional[InitBudget] = None,
+        refresh_interval: Optional[float] = None,
+    ) -> InitFuncHolder:
+        # memo caches are shared per factory, so they see the unwrapped one
+        cache_init_func = init_func
+        if kwargs and has_resources(kwargs):
+            init_func = ResourceInitFunc(init_func)
+        if persist is not None:
+            assert scope in (
+                Scope.singleton,
+                Scope.soft,
+            ), f"{key} is persisted but not bound as a singleton"
+            init_func = PersistedInitFunc(
+                init_func, key, kwargs, persist, origin=cache_init_func
+            )
+        if self.init_watchdog.enabled(init_timeout):
+            init_func = WatchedInitFunc(
+                init_func, key, self.init_watchdog, init_timeout
+            )
+        if init == InitMode.background:
+            assert (
+                scope == Scope.singleton
+            ), f"{key} is initialized in background but not bound as a singleton"
+            background_holder = BackgroundHolder(
+                init_func,
+                kwargs=kwargs,
+                cls_key=cls_key,
+                attr_instance_injector=attr_instance_injector,
+            )
+            background_holder.lock.label = key
+            self.background_initializer.register(key, background_holder)
+            return background_holder
+        if prefetch > 0:
+            assert (
+                scope == Scope.prototype
+            ), f"{key} is prefetched but not bound as a prototype"
+            prefetch_holder = PrefetchHolder(
+                init_func,
+                self.background_initializer,
+                prefetch,
+                kwargs=kwargs,
+                cls_key=cls_key,
+                attr_instance_injector=attr_instance_injector,
+            )
+            self.background_initializer.register_prefetch(key, prefetch_holder)
+            return prefetch_holder
+        if scope == Scope.singleton:
+            singleton_holder = SingletonHolder(
+                init_func,
+                kwargs=kwargs,
+                cls_key=cls_key,
+                attr_instance_injector=attr_instance_injector,
+            )
+            # deadlock and circular dependency errors name the binding key
+            singleton_holder.lock.label = key
+            return singleton_holder
+        if scope == Scope.refresh:
+            refresh_holder = RefreshHolder(
+                init_func,
+                self.background_initializer,
+                refresh_interval
+                if refresh_interval is not None
+                else DEFAULT_REFRESH_INTERVAL,
+                kwargs=kwargs,
+                cls_key=cls_key,
+                attr_instance_injector=attr_instance_injector,
+            )
+            refresh_holder.lock.label = key
+            self.background_initializer.register_refresh(key, refresh_holder)
+            return refresh_holder
+        if scope == Scope.soft:
+            soft_holder = SoftHolder(
+                init_func,
+                self.soft_registry,
+                kwargs=kwargs,
+                cls_key=cls_key,
+                attr_instance_injector=attr_instance_injector,
+            )
+            soft_holder.lock.label = key
+            self.soft_registry.register(self.soft_key(key), soft_holder)
+            return soft_holder
+        if scope == Scope.cached:
+            params_key = freeze(
+                (
+                    cls_key,
+                    kwargs,
+                    attr_instance_injector.spec()
+                    if attr_instance_injector is not None
+                    else None,
+                )
+            )
+            memo_cache = self.bean_cache.register(
+                key, cache_init_func, params_key, cache
+            )
+            return CachedHolder(
+                init_func,
+                memo_cache,
+                params_key,
+                kwargs=kwargs,
+                cls_key=cls_key,
+                attr_instance_injector=attr_instance_injector,
+            )
+        return PrototypeHolder(
+            init_func,
+            kwargs=kwargs,
+            cls_key=cls_key,
+            attr_instance_injector=attr_instance_injector,
+        )
+
     def bind_component(self, component_data: ComponentData) -> None:
         assert self.binder is not None
-        provider_func = component_data.cls
-
-        if component_data.scope == Scope.singleton:
-            singleton_holder = SingletonHolder(provider_func)
-            self.bind_to_provider(component_data.get_key(), singleton_holder.get)
-        else:
-            prototype_holder = PrototypeHolder(provider_func)
-            self.bind_to_provider(component_data.get_key(), prototype_holder.get)
+        _key = component_data.get_key()
+        holder = self.create_holder(
+            _key,
+            component_data.scope,
+            component_data.cls,
+            cache=component_data.cache,
+            persist=component_data.persist,
+            init=component_data.init,
+            prefetch=component_data.prefetch,
+            init_timeout=component_data.init_timeout,
+            refresh_interval=component_data.refresh_interval,
+        )
+        self.bind_to_provider(_key, self.get_provider(holder))
 
     def bind_configuration(self, configuration_data: ConfigurationData) -> None:
         assert self.binder is not None
@@ -238,23 +1122,39 @@ class AutoBinder:
 
     def bind_bean(self, bean_data: BeanData) -> None:
         assert self.binder is not None
-        if bean_data.scope == Scope.singleton:
-            singleton_holder = SingletonHolder(bean_data.func, cls_key=bean_data.cls)
-            self.bind_to_provider(bean_data.get_key(), singleton_holder.get)
-        else:
-            prototype_holder = PrototypeHolder(bean_data.func, cls_key=bean_data.cls)
-            self.bind_to_provider(bean_data.get_key(), prototype_holder.get)
+        _key = bean_data.get_key()
+        holder = self.create_holder(
+            _key,
+            bean_data.scope,
+            bean_data.func,
+            cls_key=bean_data.cls,
+            cache=bean_data.cache,
+            persist=bean_data.persist,
+            init=bean_data.init,
+            prefetch=bean_data.prefetch,
+            init_timeout=bean_data.init_timeout,
+            refresh_interval=bean_data.refresh_interval,
+        )
+        self.bind_to_provider(_key, self.get_provider(holder))
 
     def bind_configurable_component(
         self, configurable_component_data: ConfigurableComponentData
     ) -> None:
         assert self.binder is not None
+        provider = self.create_configurable_component_provider(
+            configurable_component_data
+        )
+        self.bind_to_provider(configurable_component_data.get_key(), provider)
+
+    def create_configurable_component_provider(
+        self, configurable_component_data: ConfigurableComponentData
+    ) -> inject.Provider:
         assert configurable_component_data.config is not None
 
         attr_instance_injector = None
         if configurable_component_data.config is not None:
             attr_instance_injector = AttrInstanceInjector(
-                configurable_component_data.config,
+                configurable_component_data.config, self.binding_key_map
             )
             if not attr_instance_injector.attr_key_map:
                 attr_instance_injector = None
@@ -264,38 +1164,102 @@ class AutoBinder:
         if issubclass(
             configurable_component_data.cls, BaseParserProvider
         ) or issubclass(configurable_component_data.cls, BaseParser):
+            memo_cache = None
+            params_key = None
+            persist = configurable_component_data.persist
+            init = configurable_component_data.init
+            prefetch = configurable_component_data.prefetch
+            init_timeout = configurable_component_data.get_init_timeout()
+            refresh_interval = configurable_component_data.get_refresh_interval()
+            if (
+                _scope in (Scope.soft, Scope.refresh)
+                or persist is not None
+                or init == InitMode.background
+                or prefetch > 0
+                or init_timeout is not None
+            ):
+                # the init func holder owns the product, the parser holder only parses
+                parser_holder = ParserHolder(
+                    configurable_component_data.cls,
+                    configurable_component_data.config,
+                    Scope.prototype,
+                    attr_instance_injector=attr_instance_injector,
+                )
+                parser_holder.lock.label = _key
+                init_func: Callable[..., Any] = parser_holder.create_product
+                if persist is not None:
+                    init_func = PersistedInitFunc(
+                        init_func,
+                        _key,
+                        configurable_component_data.config.as_plain_ordered_dict(),
+                        persist,
+                        origin=configurable_component_data.cls,
+                    )
+                return self.get_provider(
+                    self.create_holder(
+                        _key,
+                        _scope,
+                        init_func,
+                        attr_instance_injector=attr_instance_injector,
+                        init=init,
+                        prefetch=prefetch,
+                        init_timeout=init_timeout,
+                        refresh_interval=refresh_interval,
+                    )
+                )
+            if _scope == Scope.cached:
+                params_key = freeze(
+                    configurable_component_data.config.as_plain_ordered_dict()
+                )
+                memo_cache = self.bean_cache.register(
+                    _key,
+                    configurable_component_data.cls,
+                    params_key,
+                    configurable_component_data.cache,
+                )
             parser_holder = ParserHolder(
                 configurable_component_data.cls,
                 configurable_component_data.config,
                 _scope,
                 attr_instance_injector=attr_instance_injector,
+                memo_cache=memo_cache,
+                params_key=params_key,
+                # per-entry attr injection mutates the parser, so it can't be shared
+                parser_pool=self.parser_pool
+                if attr_instance_injector is None
+                else None,
             )
-            self.bind_to_provider(_key, parser_holder.get)
-            return
+            # deadlock and circular dependency errors name the binding key
+            parser_holder.lock.label = _key
+            if attr_instance_injector is None and _scope == Scope.singleton:
+                self.get_parser_batch(configurable_component_data.cls).add(
+                    parser_holder
+                )
+            return self.get_provider(parser_holder)
 
-        needed_kwargs = inspect.getfullargspec(configurable_component_data.cls).args
-        candidate_kwargs = {}
-        if configurable_component_data.config is not None:
-            candidate_kwargs = (
-                configurable_component_data.config.as_plain_ordered_dict()
-            )
-        kwargs = {}
-        for needed_kwarg in needed_kwargs:
-            if needed_kwarg == "self" or needed_kwarg not in candidate_kwargs:
-                continue
-            kwargs[needed_kwarg] = candidate_kwargs[needed_kwarg]
+        kwargs_plan = KwargsPlan.of(configurable_component_data.cls)
+        kwargs = kwargs_plan.extract(
+            configurable_component_data.config,
+            key=_key,
+            coerce_types=configurable_component_data.coerce_types,
+            excluded_keys=frozenset(attr_instance_injector.attr_key_map)
+            if attr_instance_injector is not None
+            else frozenset(),
+        )
 
-        if _scope == Scope.singleton:
-            singleton_holder = SingletonHolder(
-                configurable_component_data.cls,
-                kwargs=kwargs,
-                attr_instance_injector=attr_instance_injector,
-            )
-            self.bind_to_provider(_key, singleton_holder.get)
-        else:
-            prototype_holder = PrototypeHolder(
-                configurable_component_data.cls,
-                kwargs=kwargs,
-                attr_instance_injector=attr_instance_injector,
-            )
-            self.bind_to_provider(_key, prototype_holder.get)
+        holder = self.create_holder(
+            _key,
+            _scope,
+            configurable_component_data.cls,
+            kwargs=kwargs,
+            attr_instance_injector=attr_instance_injector,
+            cache=configurable_component_data.cache,
+            persist=configurable_component_data.persist,
+            init=configurable_component_data.init,
+            prefetch=configurable_component_data.prefetch,
+            init_timeout=configurable_component_data.get_init_timeout(),
+            refresh_interval=configurable_component_data.get_refresh_interval(),
+        )
+        # parsers receive the config tree, plain components only need the kwargs
+        configurable_component_data.release_config()
+        return self.get_provider(holder)
@@ -0,0 +1,249 @@
+import contextvars
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from pyspring.auto import BackgroundHolder, PrefetchHolder, RefreshHolder
+
+
+class PrefetchStats:
+    hits: int
+    misses: int
+    produced: int
+    failures: int
+    depth: int
+
+    def __init__(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        produced: int = 0,
+        failures: int = 0,
+        depth: int = 0,
+    ) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.produced = produced
+        self.failures = failures
+        self.depth = depth
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"PrefetchStats(hits={self.hits}, misses={self.misses}, "
+            + f"produced={self.produced}, failures={self.failures}, "
+            + f"depth={self.depth})"
+        )
+
+
+class RefreshStats:
+    refreshes: int
+    failures: int
+    last_error: Optional[BaseException]
+
+    def __init__(
+        self,
+        refreshes: int = 0,
+        failures: int = 0,
+        last_error: Optional[BaseException] = None,
+    ) -> None:
+        self.refreshes = refreshes
+        self.failures = failures
+        self.last_error = last_error
+
+    def __repr__(self) -> str:
+        return (
+            f"RefreshStats(refreshes={self.refreshes}, failures={self.failures}, "
+            + f"last_error={self.last_error!r})"
+        )
+
+
+class ContextExecutor(Executor):
+    """Submits to another executor, running each call in a fresh ``context()``.
+
+    Lets a partition share the container's worker threads while its builds
+    still resolve partition-first.
+    """
+
+    def __init__(
+        self,
+        get_executor: Callable[[], Executor],
+        context: Callable[[], contextvars.Context],
+    ) -> None:
+        self.get_executor = get_executor
+        self.context = context
+
+    def submit(  # type: ignore
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> "Future[Any]":
+        context = self.context()
+        return self.get_executor().submit(
+            context.run, fn, *args, **kwargs  # type: ignore
+        )
+
+
+class BackgroundInitializer:
+    """Container-wide registry of work done off the request path.
+
+    Holds the singletons bound with ``init="background"``, the prototypes
+    bound with ``prefetch=N`` and the beans bound with ``Scope.refresh``.
+    ``start()`` submits the builds and the initial
+    refills to the executor; it runs once the injector is installed, so
+    constructors can resolve their dependencies. ``ready()`` / ``wait()`` let
+    health checks block on critical beans.
+    """
+
+    executor: Optional[Executor]
+    max_workers: Optional[int]
+    holders: Dict[Any, "BackgroundHolder"]
+    prefetch_holders: Dict[Any, "PrefetchHolder"]
+    refresh_holders: Dict[Any, "RefreshHolder"]
+    started: bool
+
+    def __init__(
+        self, executor: Optional[Executor] = None, max_workers: Optional[int] = None
+    ) -> None:
+        self.executor = executor
+        self.max_workers = max_workers
+        self.holders = {}
+        self.prefetch_holders = {}
+        self.refresh_holders = {}
+        self.started = False
+        self.lock = threading.Lock()
+
+    def register(self, binding_key: Any, holder: "BackgroundHolder") -> None:
+        with self.lock:
+            self.holders[binding_key] = holder
+            if self.started:
+                holder.start(self.get_executor())
+
+    def register_prefetch(self, binding_key: Any, holder: "PrefetchHolder") -> None:
+        with self.lock:
+            self.prefetch_holders[binding_key] = holder
+            if self.started:
+                holder.schedule_refill(self.get_executor())
+
+    def register_refresh(self, binding_key: Any, holder: "RefreshHolder") -> None:
+        with self.lock:
+            self.refresh_holders[binding_key] = holder
+
+    def unregister(self, binding_key: Any) -> None:
+        with self.lock:
+            self.holders.pop(binding_key, None)
+            self.prefetch_holders.pop(binding_key, None)
+            self.refresh_holders.pop(binding_key, None)
+
+    def refill(self, holder: "PrefetchHolder") -> None:
+        # before start() the injector may not be installed yet
+        if self.started:
+            holder.schedule_refill(self.get_executor())
+
+    def refresh(self, holder: "RefreshHolder") -> None:
+        if self.started:
+            holder.schedule_refresh(self.get_executor())
+
+    def get_executor(self) -> Executor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="pyspring-init"
+            )
+        return self.executor
+
+    def start(self) -> None:
+        with self.lock:
+            if self.started:
+                return
+            self.started = True
+            if not self.holders and not self.prefetch_holders:
+                return
+            executor = self.get_executor()
+            for holder in self.holders.values():
+                holder.start(executor)
+            for prefetch_holder in self.prefetch_holders.values():
+                prefetch_holder.schedule_refill(executor)
+
+    def get_holders(
+        self, keys: Optional[Iterable[Any]]
+    ) -> Iterable["BackgroundHolder"]:
+        if keys is None:
+            return list(self.holders.values())
+        holders = []
+        for key in keys:
+            holder = self.holders.get(key)
+            if holder is None:
+                raise KeyError(f"{key} is not initialized in background")
+            holders.append(holder)
+        return holders
+
+    def ready(self, keys: Optional[Iterable[Any]] = None) -> bool:
+        """True once every holder (or every holder of ``keys``) built successfully."""
+        return all(holder.ready() for holder in self.get_holders(keys))
+
+    def wait(
+        self, keys: Optional[Iterable[Any]] = None, timeout: Optional[float] = None
+    ) -> bool:
+        """Wait for the builds to finish, returns ``ready()``."""
+        holders = self.get_holders(keys)
+        futures = [holder.future for holder in holders if holder.future is not None]
+        wait(futures, timeout=timeout)
+        return all(holder.ready() for holder in holders)
+
+    def add_done_callback(self, callback: Callable[[], Any]) -> None:
+        """Call ``callback`` once the background builds started so far finished."""
+        futures = [
+            holder.future
+            for holder in list(self.holders.values())
+            if holder.future is not None
+        ]
+        if not futures:
+            callback()
+            return
+        pending = [len(futures)]
+        lock = threading.Lock()
+
+        def on_done(_: Any) -> None:
+            with lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            callback()
+
+        for future in futures:
+            future.add_done_callback(on_done)
+
+    def errors(self) -> Dict[Any, BaseException]:
+        errors = {}
+        for key, holder in list(self.holders.items()):
+            future = holder.future
+            if future is not None and future.done() and not future.cancelled():
+                error = future.exception()
+                if error is not None:
+                    errors[key] = error
+        return errors
+
+    def refresh_stats(self, binding_key: Any) -> RefreshStats:
+        holder = self.refresh_holders.get(binding_key)
+        if holder is None:
+            raise KeyError(f"{binding_key} is not bound with Scope.refresh")
+        return holder.get_stats()
+
+    def prefetch_stats(self, binding_key: Optional[Any] = None) -> PrefetchStats:
+        if binding_key is not None:
+            holder = self.prefetch_holders.get(binding_key)
+            if holder is None:
+                raise KeyError(f"{binding_key} is not bound with prefetch")
+            return holder.get_stats()
+        total = PrefetchStats()
+        for holder in list(self.prefetch_holders.values()):
+            stats = holder.get_stats()
+            total.hits += stats.hits
+            total.misses += stats.misses
+            total.produced += stats.produced
+            total.failures += stats.failures
+            total.depth += stats.depth
+        return total
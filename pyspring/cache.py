@@ -0,0 +1,189 @@
+import enum
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CachePolicy(enum.Enum):
+    lru = "lru"
+    lfu = "lfu"
+    ttl = "ttl"
+
+
+class CacheOptions:
+    policy: CachePolicy
+    max_size: int
+    ttl: Optional[float]
+
+    def __init__(
+        self,
+        policy: CachePolicy = CachePolicy.lru,
+        max_size: int = 128,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        if policy == CachePolicy.ttl and ttl is None:
+            raise ValueError("ttl must be configured for CachePolicy.ttl")
+        self.policy = policy
+        self.max_size = max_size
+        self.ttl = ttl
+
+
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            + f"evictions={self.evictions})"
+        )
+
+
+def freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple((k, freeze(v)) for k, v in sorted(value.items(), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return ("__id__", id(value))
+    return value
+
+
+class MemoCache:
+    options: CacheOptions
+    stats: CacheStats
+
+    # key -> (value, created_at, frequency)
+    entries: "OrderedDict[Hashable, Tuple[Any, float, int]]"
+
+    def __init__(self, options: CacheOptions) -> None:
+        self.options = options
+        self.stats = CacheStats()
+        self.entries = OrderedDict()
+        self.lock = threading.RLock()
+
+    def get_or_create(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, created_at, frequency = entry
+                if not self.is_expired(created_at):
+                    self.stats.hits += 1
+                    self.entries[key] = (value, created_at, frequency + 1)
+                    if self.options.policy == CachePolicy.lru:
+                        self.entries.move_to_end(key)
+                    return value
+                del self.entries[key]
+                self.stats.evictions += 1
+
+            self.stats.misses += 1
+            value = create()
+            self.evict_expired()
+            while len(self.entries) >= self.options.max_size:
+                self.evict_one()
+            self.entries[key] = (value, time.monotonic(), 1)
+            return value
+
+    def is_expired(self, created_at: float) -> bool:
+        if self.options.ttl is None:
+            return False
+        return time.monotonic() - created_at >= self.options.ttl
+
+    def evict_expired(self) -> None:
+        if self.options.ttl is None:
+            return
+        expired = [k for k, e in self.entries.items() if self.is_expired(e[1])]
+        for key in expired:
+            del self.entries[key]
+            self.stats.evictions += 1
+
+    def evict_one(self) -> None:
+        if self.options.policy == CachePolicy.lfu:
+            victim = min(self.entries, key=lambda k: self.entries[k][2])
+            del self.entries[victim]
+        else:
+            # lru keeps recently used entries at the end, ttl keeps insertion order
+            self.entries.popitem(last=False)
+        self.stats.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+
+
+class BeanCache:
+    """Container-wide registry of the memo caches backing ``Scope.cached``.
+
+    Holders sharing the same factory share one ``MemoCache``, so entries built
+    from equal config/params are reused across binding keys.
+    """
+
+    memo_caches: Dict[Any, MemoCache]
+    binding_entries: Dict[Any, Tuple[MemoCache, Hashable]]
+
+    def __init__(self) -> None:
+        self.memo_caches = {}
+        self.binding_entries = {}
+        self.lock = threading.RLock()
+
+    def register(
+        self,
+        binding_key: Any,
+        factory: Any,
+        params_key: Hashable,
+        options: Optional[CacheOptions] = None,
+    ) -> MemoCache:
+        with self.lock:
+            memo_cache = self.memo_caches.get(factory)
+            if memo_cache is None:
+                memo_cache = MemoCache(options or CacheOptions())
+                self.memo_caches[factory] = memo_cache
+            self.binding_entries[binding_key] = (memo_cache, params_key)
+            return memo_cache
+
+    def unregister(self, binding_key: Any) -> None:
+        with self.lock:
+            entry = self.binding_entries.pop(binding_key, None)
+        if entry is not None:
+            memo_cache, params_key = entry
+            memo_cache.invalidate(params_key)
+
+    def invalidate(self, binding_key: Optional[Any] = None) -> None:
+        if binding_key is None:
+            for memo_cache in list(self.memo_caches.values()):
+                memo_cache.invalidate()
+            return
+        entry = self.binding_entries.get(binding_key)
+        if entry is None:
+            raise KeyError(f"{binding_key} is not bound with Scope.cached")
+        memo_cache, params_key = entry
+        memo_cache.invalidate(params_key)
+
+    def stats(self, binding_key: Optional[Any] = None) -> CacheStats:
+        if binding_key is not None:
+            entry = self.binding_entries.get(binding_key)
+            if entry is None:
+                raise KeyError(f"{binding_key} is not bound with Scope.cached")
+            return entry[0].stats
+        total = CacheStats()
+        for memo_cache in list(self.memo_caches.values()):
+            total.hits += memo_cache.stats.hits
+            total.misses += memo_cache.stats.misses
+            total.evictions += memo_cache.stats.evictions
+        return total
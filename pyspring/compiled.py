@@ -0,0 +1,176 @@
+import inspect
+from typing import Any, Dict, FrozenSet, List, Optional
+
+import inject
+
+from pyspring.auto import (_UNSET, AutoBinder, Holder, PrototypeHolder,
+                           SingletonHolder)
+from pyspring.factory_model import BaseFactory
+
+_NO_BINDINGS: Dict[Any, inject.Provider] = {}
+
+
+def current_bindings(
+    bind_time_bindings: Dict[Any, inject.Provider]
+) -> Dict[Any, inject.Provider]:
+    # Container.register / unregister publish new bindings on the injector
+    injector = inject.get_injector()
+    if injector is None:
+        return bind_time_bindings
+    if getattr(injector, "_overrides", None):
+        # overrides are only honored by the injector lookup
+        return _NO_BINDINGS
+    return injector._bindings
+
+
+class ProviderCompiler:
+    """Generates a specialized provider function for one holder.
+
+    Everything the holder decides per call (factory or instance, scope,
+    configuration instance lookup, which attrs to inject) is decided once here
+    and baked into the generated source.
+    """
+
+    holder: Holder
+    bindings: Dict[Any, inject.Provider]
+    namespace: Dict[str, Any]
+    lines: List[str]
+
+    def __init__(self, holder: Holder, bindings: Dict[Any, inject.Provider]) -> None:
+        self.holder = holder
+        self.bindings = bindings
+        self.namespace = {
+            "_UNSET": _UNSET,
+            "_BaseFactory": BaseFactory,
+            "_bindings": bindings,
+            "_current_bindings": current_bindings,
+            "_instance": inject.instance,
+            "_getattr": getattr,
+            "_frozenset": frozenset,
+            "_dir": dir,
+            "_type": type,
+            "_isinstance": isinstance,
+            "_setattr": setattr,
+        }
+        self.lines = []
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def emit_resolve(self, indent: int, target: str, key: Any) -> None:
+        _key = self.constant(key)
+        self.emit(indent, f"_p = _current_bindings(_bindings).get({_key})")
+        self.emit(indent, f"{target} = _p() if _p is not None else _instance({_key})")
+
+    def emit_construct(self, indent: int, target: str) -> None:
+        holder = self.holder
+        assert isinstance(holder, (SingletonHolder, PrototypeHolder))
+        call_args = [self.constant(arg) for arg in holder.args]
+        if holder.cls_key is not None:
+            self.emit_resolve(indent, "_cfg", holder.cls_key)
+            call_args.insert(0, "_cfg")
+        for name, value in holder.kwargs.items():
+            call_args.append(f"{name}={self.constant(value)}")
+        init_func = self.constant(holder.init_func)
+        self.emit(indent, f"{target} = {init_func}({', '.join(call_args)})")
+
+    def emit_inject(self, indent: int, target: str) -> None:
+        attr_instance_injector = self.holder.attr_instance_injector
+        if attr_instance_injector is None:
+            return
+        attr_key_map = attr_instance_injector.attr_key_map
+        attr_names: FrozenSet[str] = frozenset(attr_key_map)
+        type_attrs = self.constant({})
+        names = self.constant(attr_names)
+        # class attributes are looked up once per product type
+        self.emit(indent, f"_attrs = {type_attrs}.get(_type({target}))")
+        self.emit(indent, "if _attrs is None:")
+        self.emit(
+            indent + 1,
+            f"_attrs = {type_attrs}[_type({target})] = "
+            + f"_frozenset(_dir(_type({target}))) & {names}",
+        )
+        self.emit(indent, f"_d = _getattr({target}, '__dict__', {{}})")
+        lazy_proxies = attr_instance_injector.lazy_proxies
+        for attr_name, key in attr_key_map.items():
+            _name = self.constant(attr_name)
+            self.emit(indent, f"if {_name} in _attrs or {_name} in _d:")
+            if attr_name in lazy_proxies:
+                # shared only while the key is stable, decided per injection
+                _lazy_proxy = self.constant(attr_instance_injector.lazy_proxy)
+                self.emit(
+                    indent + 1, f"_setattr({target}, {_name}, {_lazy_proxy}({_name}))"
+                )
+                continue
+            self.emit_resolve(indent + 1, "_v", key)
+            self.emit(indent + 1, f"_setattr({target}, {_name}, _v)")
+
+    def factory_kind(self) -> Optional[bool]:
+        # True/False when known at bind time, None when only the product can tell
+        init_func = self.holder.init_func  # type: ignore
+        if inspect.isclass(init_func):
+            return issubclass(init_func, BaseFactory)
+        return None
+
+    def emit_unwrap_factory(self, indent: int, inject_product: bool) -> None:
+        factory_kind = self.factory_kind()
+        if factory_kind is False:
+            if inject_product:
+                self.emit_inject(indent, "_inst")
+            return
+        if factory_kind is None:
+            self.emit(indent, "if _isinstance(_inst, _BaseFactory):")
+            self.emit(indent + 1, "_inst = _inst.get()")
+            self.emit_inject(indent + 1, "_inst")
+            if inject_product and self.holder.attr_instance_injector is not None:
+                self.emit(indent, "else:")
+                self.emit_inject(indent + 1, "_inst")
+            return
+        self.emit(indent, "_inst = _inst.get()")
+        self.emit_inject(indent, "_inst")
+
+    def compile_singleton(self) -> None:
+        assert isinstance(self.holder, SingletonHolder)
+        cell = self.constant([_UNSET])
+        lock = self.constant(self.holder.lock)
+        self.emit(1, f"_inst = {cell}[0]")
+        self.emit(1, "if _inst is _UNSET:")
+        self.emit(2, f"with {lock}:")
+        self.emit(3, f"_inst = {cell}[0]")
+        self.emit(3, "if _inst is _UNSET:")
+        self.emit_construct(4, "_inst")
+        self.emit(4, f"{cell}[0] = _inst")
+        self.emit_unwrap_factory(1, inject_product=True)
+
+    def compile_prototype(self) -> None:
+        self.emit_construct(1, "_inst")
+        self.emit_inject(1, "_inst")
+        self.emit_unwrap_factory(1, inject_product=False)
+
+    def compile(self) -> inject.Provider:
+        self.emit(0, "def provide():")
+        if isinstance(self.holder, SingletonHolder):
+            self.compile_singleton()
+        else:
+            self.compile_prototype()
+        self.emit(1, "return _inst")
+        source = "\n".join(self.lines)
+        filename = f"<pyspring provider {self.holder.init_func!r}>"  # type: ignore
+        exec(compile(source, filename, "exec"), self.namespace)
+        provider = self.namespace["provide"]
+        provider.__source__ = source
+        return provider
+
+
+class CompiledAutoBinder(AutoBinder):
+    def get_provider(self, holder: Holder) -> inject.Provider:
+        # cached and parser holders keep the generic holder path
+        if type(holder) not in (SingletonHolder, PrototypeHolder):
+            return super().get_provider(holder)
+        assert self.binder is not None
+        return ProviderCompiler(holder, self.binder._bindings).compile()
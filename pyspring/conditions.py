@@ -0,0 +1,172 @@
+from abc import ABC, abstractmethod
+from typing import (TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable,
+                    List, Optional, Tuple, TypeVar)
+
+if TYPE_CHECKING:
+    from pyhocon import ConfigTree
+
+T = TypeVar("T")
+
+_MISSING = object()
+_FALSE_VALUES = frozenset(("false", "no", "off", "0", ""))
+
+
+class Environment:
+    """Active profiles and config files that conditions are evaluated against.
+
+    Config files are parsed at most once per path list and shared with the
+    flattening of configured components, until ``release()`` drops the trees
+    once binding is done.
+    """
+
+    profiles: FrozenSet[str]
+    config_paths: List[str]
+    config_workers: Optional[int]
+    parsed: Dict[Tuple[str, ...], List["ConfigTree"]]
+
+    def __init__(
+        self,
+        profiles: Optional[Iterable[str]] = None,
+        config_paths: Optional[List[str]] = None,
+        config_workers: Optional[int] = None,
+    ) -> None:
+        self.profiles = frozenset(profiles or ())
+        self.config_paths = config_paths or []
+        self.config_workers = config_workers
+        self.parsed = {}
+
+    def config_trees(
+        self,
+        config_paths: Optional[List[str]] = None,
+        config_workers: Optional[int] = None,
+    ) -> List["ConfigTree"]:
+        from pyspring.scaner import parse_config_files
+
+        if config_paths is None:
+            config_paths = self.config_paths
+        parsed_key = tuple(config_paths)
+        config_trees = self.parsed.get(parsed_key)
+        if config_trees is None:
+            config_trees = parse_config_files(
+                config_paths, config_workers or self.config_workers
+            )
+            self.parsed[parsed_key] = config_trees
+        return config_trees
+
+    def release(self) -> None:
+        # later lookups, e.g. conditions of extended beans, parse the files again
+        self.parsed = {}
+
+    def get_config(self, path: str, default: Any = None) -> Any:
+        if not self.config_paths:
+            return default
+        from pyhocon import ConfigTree
+
+        # later files override earlier ones, as on bind
+        for config_tree in reversed(self.config_trees()):
+            if not isinstance(config_tree, ConfigTree):
+                continue
+            try:
+                value = config_tree.get(path, _MISSING)
+            except Exception:
+                continue
+            if value is not _MISSING:
+                return value
+        return default
+
+    def accepts_profiles(self, profiles: Iterable[str]) -> bool:
+        # matches when any profile is active, or any "!profile" is inactive
+        for profile in profiles:
+            if profile.startswith("!"):
+                if profile[1:] not in self.profiles:
+                    return True
+            elif profile in self.profiles:
+                return True
+        return False
+
+    def accepts_config(self, config: "ConfigTree") -> bool:
+        profiles = config.get("profiles", None)
+        if profiles is None:
+            return True
+        if isinstance(profiles, str):
+            profiles = [profile.strip() for profile in profiles.split(",")]
+        return self.accepts_profiles(profiles)
+
+
+class Condition(ABC):
+    @abstractmethod
+    def matches(self, environment: Environment) -> bool:
+        raise NotImplementedError()
+
+
+class ProfileCondition(Condition):
+    profiles: Tuple[str, ...]
+
+    def __init__(self, profiles: Iterable[str]) -> None:
+        self.profiles = tuple(profiles)
+
+    def matches(self, environment: Environment) -> bool:
+        return environment.accepts_profiles(self.profiles)
+
+
+class ConfigCondition(Condition):
+    path: str
+    having_value: Optional[Any]
+    match_if_missing: bool
+
+    def __init__(
+        self,
+        path: str,
+        having_value: Optional[Any] = None,
+        match_if_missing: bool = False,
+    ) -> None:
+        self.path = path
+        self.having_value = having_value
+        self.match_if_missing = match_if_missing
+
+    def matches(self, environment: Environment) -> bool:
+        value = environment.get_config(self.path, _MISSING)
+        if value is _MISSING:
+            return self.match_if_missing
+        if self.having_value is not None:
+            return str(value).lower() == str(self.having_value).lower()
+        return value is not None and str(value).lower() not in _FALSE_VALUES
+
+
+def get_conditions(target: Any) -> Tuple[Condition, ...]:
+    if isinstance(target, type):
+        # subclasses don't inherit the conditions of a decorated base class
+        return vars(target).get("__conditions__", ())
+    return getattr(target, "__conditions__", ())
+
+
+def add_condition(target: T, condition: Condition) -> T:
+    setattr(target, "__conditions__", get_conditions(target) + (condition,))
+    return target
+
+
+def matches_conditions(decorator_data: Any, environment: Environment) -> bool:
+    # beans are also excluded with the configuration class declaring them
+    for target in (
+        getattr(decorator_data, "func", None),
+        getattr(decorator_data, "cls", None),
+    ):
+        if target is None:
+            continue
+        for condition in get_conditions(target):
+            if not condition.matches(environment):
+                return False
+    return True
+
+
+def ConditionalOnConfig(
+    path: str,
+    having_value: Optional[Any] = None,
+    match_if_missing: bool = False,
+) -> Callable[[T], T]:
+    def wrapper(target: T) -> T:
+        return add_condition(
+            target, ConfigCondition(path, having_value, match_if_missing)
+        )
+
+    return wrapper
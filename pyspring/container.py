@@ -0,0 +1,174 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from inject import Binding, Constructor
+
+from pyspring.auto import AutoBinder
+from pyspring.conditions import Environment, matches_conditions
+from pyspring.decorators import ConfigurableComponentData, DecoratorData
+from pyspring.injector import EnhancementInjector
+from pyspring.scaner import (flatten_config_with_decorator_data, merge_paths,
+                             scan_all, scan_object,
+                             split_configurable_component_scan_results)
+
+
+def constant(instance: Any) -> Constructor:
+    return lambda: instance
+
+
+class OverrideLayer:
+    """Bindings shadowing the container until the layer is restored."""
+
+    __slots__ = ("bindings",)
+
+    bindings: Dict[Binding, Constructor]
+
+    def __init__(self, overrides: Dict[Binding, Any]) -> None:
+        self.bindings = {key: constant(instance) for key, instance in overrides.items()}
+
+
+class Container:
+    """Handle on an installed container for binding changes at runtime.
+
+    ``register`` / ``unregister`` / ``extend`` bind only the delta: existing
+    holders and their singletons are kept, the key indexes are updated in place
+    and the injector publishes the changed bindings in a single swap.
+    """
+
+    auto_binder: AutoBinder
+    injector: EnhancementInjector
+    environment: Environment
+    configurable_templates: List[ConfigurableComponentData]
+    config_paths: List[str]
+    override_layers: List[OverrideLayer]
+
+    def __init__(
+        self,
+        auto_binder: AutoBinder,
+        injector: EnhancementInjector,
+        environment: Optional[Environment] = None,
+        configurable_templates: Optional[List[ConfigurableComponentData]] = None,
+        config_paths: Optional[List[str]] = None,
+    ) -> None:
+        self.auto_binder = auto_binder
+        self.injector = injector
+        self.environment = environment or Environment(config_paths=config_paths)
+        self.configurable_templates = list(configurable_templates or [])
+        self.config_paths = list(config_paths or [])
+        self.override_layers = []
+        self.lock = threading.RLock()
+        injector.update_bindings({Container: lambda: self})
+
+    def bind(self, decorator_data_list: List[DecoratorData]) -> List[Any]:
+        with self.lock:
+            new_bindings = self.auto_binder.bind_delta(decorator_data_list)
+            self.injector.update_bindings(new_bindings)
+        return [decorator_data.get_key() for decorator_data in decorator_data_list]
+
+    def bind_scan_results(
+        self, scan_results: List[DecoratorData], config_paths: List[str]
+    ) -> List[Any]:
+        with self.lock:
+            # conditions of the new beans already see the new config files
+            self.environment.config_paths = self.config_paths + config_paths
+            (
+                configurable_templates,
+                decorator_data_list,
+            ) = split_configurable_component_scan_results(
+                [
+                    scan_result
+                    for scan_result in scan_results
+                    if matches_conditions(scan_result, self.environment)
+                ]
+            )
+            # new templates see every config file, known templates only new ones
+            decorator_data_list.extend(
+                flatten_config_with_decorator_data(
+                    configurable_templates,
+                    self.config_paths + config_paths,
+                    environment=self.environment,
+                )
+            )
+            decorator_data_list.extend(
+                flatten_config_with_decorator_data(
+                    self.configurable_templates,
+                    config_paths,
+                    environment=self.environment,
+                )
+            )
+            self.configurable_templates.extend(configurable_templates)
+            self.config_paths.extend(config_paths)
+            keys = self.bind(decorator_data_list)
+            self.environment.release()
+            return keys
+
+    def register(self, *targets: Any) -> List[Any]:
+        """Bind modules, decorated classes or bean functions, returns their keys."""
+        scan_results: List[DecoratorData] = []
+        for target in targets:
+            scan_results.extend(scan_object(target))
+        return self.bind_scan_results(scan_results, [])
+
+    def extend(
+        self,
+        path: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+        config_path: Optional[str] = None,
+        config_paths: Optional[List[str]] = None,
+        packages: Optional[List[str]] = None,
+    ) -> List[Any]:
+        """Scan more paths/packages and load more config files, returns new keys."""
+        scan_results: List[DecoratorData] = []
+        if merge_paths(path, paths) or packages:
+            scan_results = scan_all(path, paths, packages, None, self.environment)
+        return self.bind_scan_results(
+            scan_results, merge_paths(config_path, config_paths)
+        )
+
+    def unregister(self, key: Any) -> bool:
+        with self.lock:
+            if key not in self.injector._bindings:
+                return False
+            self.auto_binder.unbind(key)
+            self.injector.update_bindings({}, removed_keys=[key])
+            return True
+
+    def publish_overrides(self) -> None:
+        overrides: Dict[Binding, Constructor] = {}
+        for layer in self.override_layers:
+            overrides.update(layer.bindings)
+        self.injector.set_overrides(overrides)
+
+    def override(self, overrides: Dict[Binding, Any]) -> OverrideLayer:
+        """Shadow keys with the given instances, until ``restore`` of the layer.
+
+        Base bindings and holders are not touched, so a container built once
+        (and shared with forked workers) can be overridden per test. Singletons
+        built while a layer is active keep what they resolved, as do providers
+        compiled with ``compiled=True``; build them before overriding.
+        """
+        layer = OverrideLayer(overrides)
+        with self.lock:
+            self.override_layers.append(layer)
+            self.publish_overrides()
+        return layer
+
+    def restore(self, layer: Optional[OverrideLayer] = None) -> None:
+        """Remove ``layer``, or every layer when not given."""
+        with self.lock:
+            if layer is None:
+                self.override_layers = []
+            else:
+                self.override_layers.remove(layer)
+            self.publish_overrides()
+
+    @contextmanager
+    def scoped_overrides(
+        self, overrides: Dict[Binding, Any]
+    ) -> Iterator[OverrideLayer]:
+        layer = self.override(overrides)
+        try:
+            yield layer
+        finally:
+            self.restore(layer)
@@ -1,12 +1,19 @@
 import enum
 import inspect
-from typing import Any, Callable, List, Optional, Type
-
-from pyhocon import ConfigTree
+import sys
+from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Dict, FrozenSet,
+                    Iterable, List, Optional, Type, Union)
 
+from pyspring.cache import CacheOptions
+from pyspring.conditions import ProfileCondition, add_condition
 from pyspring.factory_model import (BaseFactory, BaseParser,
                                     BaseParserProvider, get_product_type)
-from pyspring.scope import Scope
+from pyspring.persist import PersistOptions
+from pyspring.scope import InitMode, Scope
+from pyspring.watchdog import InitBudget, InitTimeout
+
+if TYPE_CHECKING:
+    from pyhocon import ConfigTree
 
 
 class DecoratorType(enum.Enum):
@@ -17,10 +24,9 @@ class DecoratorType(enum.Enum):
 
 
 class DecoratorData:
-    decorator_type: DecoratorType
+    __slots__ = ()
 
-    def __init__(self, decorator_type: DecoratorType):
-        self.decorator_type = decorator_type
+    decorator_type: ClassVar[DecoratorType]
 
     def get_key(self) -> Any:
         raise NotImplementedError()
@@ -33,18 +39,54 @@ class DecoratorData:
 
 
 class ComponentData(DecoratorData):
-    decorator_type: DecoratorType = DecoratorType.component
+    __slots__ = (
+        "cls",
+        "product_cls",
+        "scope",
+        "key",
+        "cache",
+        "persist",
+        "init",
+        "prefetch",
+        "init_timeout",
+        "refresh_interval",
+    )
+
+    decorator_type: ClassVar[DecoratorType] = DecoratorType.component
     cls: type
     product_cls: type
     scope: Scope
     key: Any
+    cache: Optional[CacheOptions]
+    persist: Optional[PersistOptions]
+    init: InitMode
+    prefetch: int
+    init_timeout: Optional[InitBudget]
+    refresh_interval: Optional[float]
 
-    def __init__(self, cls: type, product_cls: type, scope: Scope, key: Any):
-        super().__init__(DecoratorType.component)
+    def __init__(
+        self,
+        cls: type,
+        product_cls: type,
+        scope: Scope,
+        key: Any,
+        cache: Optional[CacheOptions] = None,
+        persist: Optional[PersistOptions] = None,
+        init: InitMode = InitMode.lazy,
+        prefetch: int = 0,
+        init_timeout: Optional[InitBudget] = None,
+        refresh_interval: Optional[float] = None,
+    ):
         self.cls = cls
         self.product_cls = product_cls
         self.scope = scope
         self.key = key
+        self.cache = cache
+        self.persist = persist
+        self.init = init
+        self.prefetch = prefetch
+        self.init_timeout = init_timeout
+        self.refresh_interval = refresh_interval
 
     def get_key(self) -> Any:
         return self.key
@@ -58,11 +100,12 @@ class ComponentData(DecoratorData):
 
 
 class ConfigurationData(DecoratorData):
-    decorator_type: DecoratorType = DecoratorType.configuration
+    __slots__ = ("cls",)
+
+    decorator_type: ClassVar[DecoratorType] = DecoratorType.configuration
     cls: type
 
     def __init__(self, cls: type):
-        super().__init__(DecoratorType.configuration)
         self.cls = cls
 
     def get_key(self) -> Any:
@@ -79,12 +122,32 @@ class ConfigurationData(DecoratorData):
 
 
 class BeanData(DecoratorData):
-    decorator_type: DecoratorType = DecoratorType.bean
+    __slots__ = (
+        "cls",
+        "product_cls",
+        "func",
+        "scope",
+        "key",
+        "cache",
+        "persist",
+        "init",
+        "prefetch",
+        "init_timeout",
+        "refresh_interval",
+    )
+
+    decorator_type: ClassVar[DecoratorType] = DecoratorType.bean
     cls: Optional[type]
     product_cls: type
     func: Callable
     scope: Scope
     key: Any
+    cache: Optional[CacheOptions]
+    persist: Optional[PersistOptions]
+    init: InitMode
+    prefetch: int
+    init_timeout: Optional[InitBudget]
+    refresh_interval: Optional[float]
 
     def __init__(
         self,
@@ -93,13 +156,24 @@ class BeanData(DecoratorData):
         scope: Scope,
         key: Any,
         cls: Optional[type] = None,
+        cache: Optional[CacheOptions] = None,
+        persist: Optional[PersistOptions] = None,
+        init: InitMode = InitMode.lazy,
+        prefetch: int = 0,
+        init_timeout: Optional[InitBudget] = None,
+        refresh_interval: Optional[float] = None,
     ):
-        super().__init__(DecoratorType.bean)
         self.func = func
         self.product_cls = product_cls
         self.scope = scope
         self.key = key
         self.cls = cls
+        self.cache = cache
+        self.persist = persist
+        self.init = init
+        self.prefetch = prefetch
+        self.init_timeout = init_timeout
+        self.refresh_interval = refresh_interval
 
     def get_key(self) -> Any:
         return self.key
@@ -108,7 +182,7 @@ class BeanData(DecoratorData):
         return self.product_cls
 
     @staticmethod
-    def from_func(func: type) -> "BeanData":
+    def from_func(func: Callable[..., Any]) -> "BeanData":
         return getattr(func, "__binding_data__")
 
     @staticmethod
@@ -123,31 +197,83 @@ class BeanData(DecoratorData):
         return scan_results
 
 
+_SCAN_CLS_NAMES: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+
+def intern_scan_cls_names(scan_cls_names: Iterable[str]) -> FrozenSet[str]:
+    names = frozenset(sys.intern(name) for name in scan_cls_names)
+    return _SCAN_CLS_NAMES.setdefault(names, names)
+
+
 class ConfigurableComponentData(DecoratorData):
-    decorator_type: DecoratorType = DecoratorType.configurable_component
+    __slots__ = (
+        "cls",
+        "product_cls",
+        "scan_cls_names",
+        "scope",
+        "config_path",
+        "config",
+        "cache",
+        "coerce_types",
+        "persist",
+        "init",
+        "prefetch",
+        "init_timeout",
+        "refresh_interval",
+        "key",
+        "config_scope",
+    )
+
+    decorator_type: ClassVar[DecoratorType] = DecoratorType.configurable_component
     cls: type
     product_cls: type
-    scan_cls_names: List[str] = []
+    scan_cls_names: FrozenSet[str]
     scope: Optional[Scope]
     config_path: Optional[str]
-    config: Optional[ConfigTree]
+    config: Optional["ConfigTree"]
+    cache: Optional[CacheOptions]
+    coerce_types: bool
+    persist: Optional[PersistOptions]
+    init: InitMode
+    prefetch: int
+    init_timeout: Optional[InitBudget]
+    refresh_interval: Optional[float]
+
+    # resolved from config, kept after the config tree is released
+    key: Optional[Any]
+    config_scope: Optional[Scope]
 
     def __init__(
         self,
         cls: type,
         product_cls: type,
-        scan_cls_names: List[str],
+        scan_cls_names: Iterable[str],
         scope: Optional[Scope] = None,
         config_path: Optional[str] = None,
-        config: Optional[ConfigTree] = None,
+        config: Optional["ConfigTree"] = None,
+        cache: Optional[CacheOptions] = None,
+        coerce_types: bool = False,
+        persist: Optional[PersistOptions] = None,
+        init: InitMode = InitMode.lazy,
+        prefetch: int = 0,
+        init_timeout: Optional[InitBudget] = None,
+        refresh_interval: Optional[float] = None,
     ):
-        super().__init__(DecoratorType.configurable_component)
         self.cls = cls
         self.product_cls = product_cls
-        self.scan_cls_names = scan_cls_names
+        self.scan_cls_names = intern_scan_cls_names(scan_cls_names)
         self.scope = scope
         self.config_path = config_path
         self.config = config
+        self.cache = cache
+        self.coerce_types = coerce_types
+        self.persist = persist
+        self.init = init
+        self.prefetch = prefetch
+        self.init_timeout = init_timeout
+        self.refresh_interval = refresh_interval
+        self.key = None
+        self.config_scope = None
 
     def copy(self) -> "ConfigurableComponentData":
         return ConfigurableComponentData(
@@ -157,22 +283,58 @@ class ConfigurableComponentData(DecoratorData):
             scope=self.scope,
             config_path=self.config_path,
             config=self.config,
+            cache=self.cache,
+            coerce_types=self.coerce_types,
+            persist=self.persist,
+            init=self.init,
+            prefetch=self.prefetch,
+            init_timeout=self.init_timeout,
+            refresh_interval=self.refresh_interval,
         )
 
+    def with_config(self, config: "ConfigTree") -> "ConfigurableComponentData":
+        data = self.copy()
+        data.config = config
+        return data
+
     def get_key(self) -> Any:
-        assert self.config is not None
-        return self.config.get("key", None) or self.product_cls
+        if self.key is None:
+            assert self.config is not None
+            self.key = self.config.get("key", None) or self.product_cls
+        return self.key
 
     def get_product_type(self) -> Type[Any]:
         return self.product_cls
 
     def get_scope(self) -> Scope:
+        if self.config_scope is None:
+            assert self.config is not None
+            _scope_str = self.config.get("scope", None)
+            if _scope_str is not None:
+                self.config_scope = Scope[_scope_str]
+            else:
+                self.config_scope = self.scope or Scope.singleton
+        return self.config_scope
+
+    def get_init_timeout(self) -> Optional[InitBudget]:
         assert self.config is not None
-        _scope_str = self.config.get("scope", None)
-        if _scope_str is not None:
-            return Scope[_scope_str]
-        else:
-            return self.scope or Scope.singleton
+        init_timeout = self.config.get("init_timeout", None)
+        if init_timeout is not None:
+            return InitBudget.of(init_timeout)
+        return self.init_timeout
+
+    def get_refresh_interval(self) -> Optional[float]:
+        assert self.config is not None
+        refresh_interval = self.config.get("refresh_interval", None)
+        if refresh_interval is not None:
+            return float(refresh_interval)
+        return self.refresh_interval
+
+    def release_config(self) -> None:
+        # resolve everything derived from the config before dropping the tree
+        self.get_key()
+        self.get_scope()
+        self.config = None
 
     @staticmethod
     def from_cls(cls: type) -> "ConfigurableComponentData":
@@ -182,6 +344,14 @@ class ConfigurableComponentData(DecoratorData):
 def ConfigurableComponent(
     scope: Optional[Scope] = None,
     config_path: Optional[str] = None,
+    cache: Optional[CacheOptions] = None,
+    coerce_types: bool = False,
+    persist: Optional[PersistOptions] = None,
+    init: Union[str, InitMode] = InitMode.lazy,
+    prefetch: int = 0,
+    init_timeout: InitTimeout = None,
+    refresh_interval: Optional[float] = None,
+    profiles: Optional[Iterable[str]] = None,
 ) -> Callable[[Type], Type]:
     def wrapper(cls: type):
         if (
@@ -209,7 +379,16 @@ def ConfigurableComponent(
             scan_cls_names=scan_cls_names,
             scope=scope,
             config_path=config_path,
+            cache=cache,
+            coerce_types=coerce_types,
+            persist=persist,
+            init=InitMode(init),
+            prefetch=prefetch,
+            init_timeout=InitBudget.of(init_timeout),
+            refresh_interval=refresh_interval,
         )
+        if profiles is not None:
+            add_condition(cls, ProfileCondition(profiles))
         setattr(cls, "__binding__", DecoratorType.configurable_component)
         setattr(cls, "__binding_data__", data)
         return cls
@@ -220,6 +399,13 @@ def ConfigurableComponent(
 def Component(
     key: Optional[Any] = None,
     scope: Scope = Scope.singleton,
+    cache: Optional[CacheOptions] = None,
+    persist: Optional[PersistOptions] = None,
+    init: Union[str, InitMode] = InitMode.lazy,
+    prefetch: int = 0,
+    init_timeout: InitTimeout = None,
+    refresh_interval: Optional[float] = None,
+    profiles: Optional[Iterable[str]] = None,
 ) -> Callable[[Type], Type]:
     def wrapper(cls: type):
         if issubclass(cls, BaseFactory):
@@ -239,7 +425,15 @@ def Component(
             product_cls=product_cls,
             scope=scope,
             key=_key,
+            cache=cache,
+            persist=persist,
+            init=InitMode(init),
+            prefetch=prefetch,
+            init_timeout=InitBudget.of(init_timeout),
+            refresh_interval=refresh_interval,
         )
+        if profiles is not None:
+            add_condition(cls, ProfileCondition(profiles))
         setattr(cls, "__binding__", DecoratorType.component)
         setattr(cls, "__binding_data__", data)
         return cls
@@ -249,8 +443,9 @@ def Component(
 
 def Prototype(
     key: Optional[Any] = None,
+    prefetch: int = 0,
 ) -> Callable[[Type], Type]:
-    return Component(key=key, scope=Scope.prototype)
+    return Component(key=key, scope=Scope.prototype, prefetch=prefetch)
 
 
 def Singleton(
@@ -259,11 +454,22 @@ def Singleton(
     return Component(key=key, scope=Scope.singleton)
 
 
-def Configuration() -> Callable[[Type], Type]:
+def Cached(
+    key: Optional[Any] = None,
+    cache: Optional[CacheOptions] = None,
+) -> Callable[[Type], Type]:
+    return Component(key=key, scope=Scope.cached, cache=cache)
+
+
+def Configuration(
+    profiles: Optional[Iterable[str]] = None,
+) -> Callable[[Type], Type]:
     def wrapper(cls: type):
         data = ConfigurationData(
             cls=cls,
         )
+        if profiles is not None:
+            add_condition(cls, ProfileCondition(profiles))
         setattr(cls, "__binding__", DecoratorType.configuration)
         setattr(cls, "__binding_data__", data)
         return cls
@@ -275,6 +481,13 @@ def Bean(
     key: Optional[Any] = None,
     scope: Scope = Scope.singleton,
     use_func_name_as_key: bool = False,
+    cache: Optional[CacheOptions] = None,
+    persist: Optional[PersistOptions] = None,
+    init: Union[str, InitMode] = InitMode.lazy,
+    prefetch: int = 0,
+    init_timeout: InitTimeout = None,
+    refresh_interval: Optional[float] = None,
+    profiles: Optional[Iterable[str]] = None,
 ) -> Callable[..., Any]:
     def wrapper(func: Callable[..., Any]):
         product_cls = inspect.signature(func).return_annotation
@@ -290,7 +503,15 @@ def Bean(
             product_cls=product_cls,
             scope=scope,
             key=_key,
+            cache=cache,
+            persist=persist,
+            init=InitMode(init),
+            prefetch=prefetch,
+            init_timeout=InitBudget.of(init_timeout),
+            refresh_interval=refresh_interval,
         )
+        if profiles is not None:
+            add_condition(func, ProfileCondition(profiles))
         setattr(func, "__binding__", DecoratorType.bean)
         setattr(func, "__binding_data__", data)
         return func
@@ -300,5 +521,22 @@ def Bean(
 
 def FunctionNameBean(
     scope: Scope = Scope.singleton,
+    cache: Optional[CacheOptions] = None,
+    persist: Optional[PersistOptions] = None,
+    init: Union[str, InitMode] = InitMode.lazy,
+    prefetch: int = 0,
+    init_timeout: InitTimeout = None,
+    refresh_interval: Optional[float] = None,
+    profiles: Optional[Iterable[str]] = None,
 ) -> Callable[..., Any]:
-    return Bean(scope=scope, use_func_name_as_key=True)
+    return Bean(
+        scope=scope,
+        use_func_name_as_key=True,
+        cache=cache,
+        persist=persist,
+        init=init,
+        prefetch=prefetch,
+        init_timeout=init_timeout,
+        refresh_interval=refresh_interval,
+        profiles=profiles,
+    )
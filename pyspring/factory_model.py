@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Generic, List, Optional, Type, TypeVar, Union
 
-from pyhocon import ConfigTree
+if TYPE_CHECKING:
+    from pyhocon import ConfigTree
 
 T = TypeVar("T")
 
@@ -14,10 +15,15 @@ class BaseFactory(ABC, Generic[T]):
 
 class BaseParser(ABC, Generic[T]):
     @abstractmethod
-    def parse(self, config: ConfigTree) -> Union[T, BaseFactory[T]]:
+    def parse(self, config: "ConfigTree") -> Union[T, BaseFactory[T]]:
         pass
 
 
+class BaseBatchParser(BaseParser[T]):
+    def parse_many(self, configs: List["ConfigTree"]) -> List[Union[T, BaseFactory[T]]]:
+        return [self.parse(config) for config in configs]
+
+
 class BaseParserProvider(ABC, Generic[T]):
     @abstractmethod
     def get(self) -> BaseParser[T]:
@@ -1,8 +1,9 @@
 import inspect
-from typing import Any, Dict, Type
+from typing import Any, Dict, Iterable, Optional, Set, Type
 
-from inject import (_BINDING_LOCK, Binding, Constructor, ConstructorTypeError,
-                    Injectable, Injector, InjectorException, logger)
+from inject import (_BINDING_LOCK, BinderCallable, Binding, Constructor,
+                    ConstructorTypeError, Injectable, Injector,
+                    InjectorException, get_injector, logger)
 
 
 def match_cls(cls: Type[Any], cls_name: str) -> bool:
@@ -15,6 +16,30 @@ def match_cls(cls: Type[Any], cls_name: str) -> bool:
 
 
 class EnhancementInjector(Injector):
+    """Injector whose lookups never lock.
+
+    ``_bindings`` and ``_missing`` are never mutated once published: runtime
+    bindings and eviction build a new dict under ``_BINDING_LOCK`` and swap it
+    in, so concurrent readers (with or without the GIL) always see a complete
+    mapping.
+    """
+
+    # known-missing keys, read without locking so repeated misses stay cheap
+    _missing: Dict[Binding, str]
+    max_missing: int = 4096
+    # keys bound on first lookup to the binding of a subclass or class name
+    _runtime_aliases: Set[Binding]
+    # bindings shadowing ``_bindings`` on lookup, see ``set_overrides``
+    _overrides: Dict[Binding, Constructor]
+
+    def __init__(
+        self, config: Optional[BinderCallable] = None, bind_in_runtime: bool = True
+    ) -> None:
+        super().__init__(config, bind_in_runtime=bind_in_runtime)
+        self._missing = {}
+        self._runtime_aliases = set()
+        self._overrides = {}
+
     def bind_subclass(self, cls: Type[Any]) -> bool:
         new_bindings: Dict[Binding, Constructor] = {}
         for k, v in self._bindings.items():
@@ -28,7 +53,8 @@ class EnhancementInjector(Injector):
 
         if len(new_bindings) == 0:
             return False
-        self._bindings.update(new_bindings)
+        self.publish_bindings(new_bindings)
+        self._runtime_aliases.update(new_bindings)
         return True
 
     def bind_cls_by_name(self, cls_name: str) -> bool:
@@ -44,49 +70,155 @@ class EnhancementInjector(Injector):
 
         if len(new_bindings) == 0:
             return False
-        self._bindings.update(new_bindings)
+        self.publish_bindings(new_bindings)
+        self._runtime_aliases.update(new_bindings)
         return True
 
-    def get_instance(self, cls: Binding) -> Injectable:  # type: ignore
-        """Return an instance for a class."""
-        binding = self._bindings.get(cls)
-        if binding:
-            return binding()
+    def publish_bindings(self, new_bindings: Dict[Binding, Constructor]) -> None:
+        bindings = dict(self._bindings)
+        bindings.update(new_bindings)
+        self._bindings = bindings
+
+    def update_bindings(
+        self,
+        new_bindings: Dict[Binding, Constructor],
+        removed_keys: Iterable[Binding] = (),
+    ) -> None:
+        """Add and remove bindings of an installed injector.
+
+        Runtime aliases are dropped as well, since a new or removed subclass
+        can change what they resolve to; they are recreated on next lookup.
+        """
+        with _BINDING_LOCK:
+            bindings = dict(self._bindings)
+            for key in self._runtime_aliases:
+                bindings.pop(key, None)
+            for key in removed_keys:
+                bindings.pop(key, None)
+            bindings.update(new_bindings)
+            self._bindings = bindings
+            self._runtime_aliases = set()
+            self.invalidate_missing()
+
+    def set_overrides(self, overrides: Dict[Binding, Constructor]) -> None:
+        """Publish the bindings that shadow the base bindings on lookup.
+
+        The base ``_bindings`` dict is left as is, so removing the overrides
+        only costs publishing a new (usually empty) dict.
+        """
+        self._overrides = dict(overrides)
+
+    def remember_missing(self, cls: Binding, message: str) -> None:
+        missing = dict(self._missing)
+        if len(missing) >= self.max_missing:
+            del missing[next(iter(missing))]
+        missing[cls] = message
+        self._missing = missing
+
+    def invalidate_missing(self) -> None:
+        """Forget known-missing keys, called whenever bindings change."""
+        self._missing = {}
+
+    def find_binding(self, cls: Binding) -> Optional[Constructor]:
+        if cls in self._missing:
+            return None
 
         with _BINDING_LOCK:
-            binding = self._bindings.get(str(cls))
+            binding = self._bindings.get(cls) or self._bindings.get(str(cls))
             if binding:
-                return binding()
+                return binding
 
             if not self._bind_in_runtime:
-                raise InjectorException("No binding was found for key=%s" % cls)
+                self.remember_missing(cls, "No binding was found for key=%s" % cls)
+                return None
 
             # check whether cls is str, and cls is a class name
             if isinstance(cls, str):
                 _success = self.bind_cls_by_name(cls)
                 if _success:
-                    return self.get_instance(cls)
+                    self.invalidate_missing()
+                    return self._bindings[cls]
 
             if not callable(cls):
-                raise InjectorException(
+                self.remember_missing(
+                    cls,
                     "Cannot create a runtime binding, the key is not callable, key=%s"
-                    % cls
+                    % cls,
                 )
+                return None
 
             # check whether cls is type
             if inspect.isclass(cls):
                 _success = self.bind_subclass(cls)
                 if _success:
-                    return self.get_instance(cls)
+                    self.invalidate_missing()
+                    return self._bindings[cls]
 
             try:
                 instance = cls()
             except TypeError as previous_error:
                 raise ConstructorTypeError(cls, previous_error)
 
-            self._bindings[cls] = lambda: instance
+            self.publish_bindings({cls: lambda: instance})
+            self.invalidate_missing()
 
             logger.debug(
                 "Created a runtime binding for key=%s, instance=%s", cls, instance
             )
-            return instance
+            return self._bindings[cls]
+
+    def get_instance(self, cls: Binding) -> Injectable:  # type: ignore
+        """Return an instance for a class."""
+        overrides = self._overrides
+        if overrides:
+            binding = overrides.get(cls)
+            if binding:
+                return binding()
+
+        binding = self._bindings.get(cls)
+        if binding:
+            return binding()
+
+        # known misses raise the remembered message, without formatting
+        message = self._missing.get(cls)
+        if message is not None:
+            raise InjectorException(message)
+        binding = self.find_binding(cls)
+        if binding is None:
+            # the cache may have been invalidated by another thread meanwhile
+            message = self._missing.get(cls)
+            if message is None:
+                message = "No binding was found for key=%s" % cls
+            raise InjectorException(message)
+        return binding()
+
+    def try_instance(self, cls: Binding, default: Any = None) -> Any:
+        """Return an instance for a class, or ``default`` when it can't be bound."""
+        overrides = self._overrides
+        if overrides:
+            binding = overrides.get(cls)
+            if binding:
+                return binding()
+
+        binding = self._bindings.get(cls)
+        if binding:
+            return binding()
+
+        if cls in self._missing:
+            return default
+        binding = self.find_binding(cls)
+        if binding is None:
+            return default
+        return binding()
+
+
+def try_instance(cls: Binding, default: Any = None) -> Any:
+    injector = get_injector()
+    if injector is None:
+        return default
+    if isinstance(injector, EnhancementInjector):
+        return injector.try_instance(cls, default)
+    try:
+        return injector.get_instance(cls)
+    except InjectorException:
+        return default
@@ -0,0 +1,150 @@
+import inspect
+import threading
+import typing
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
+
+from inject import InjectorException
+
+from pyspring.resource import ResourceRef, is_resource_config
+
+if TYPE_CHECKING:
+    from pyhocon import ConfigTree
+
+# keys consumed by the container itself, never forwarded to **kwargs
+RESERVED_CONFIG_KEYS: FrozenSet[str] = frozenset(
+    ("class", "key", "scope", "profiles", "init_timeout", "refresh_interval")
+)
+
+_MISSING = object()
+
+
+def plain_value(value: Any) -> Any:
+    from pyhocon import ConfigTree
+
+    if isinstance(value, ConfigTree):
+        return value.as_plain_ordered_dict()
+    if isinstance(value, list):
+        return [plain_value(item) for item in value]
+    return value
+
+
+def config_value(value: Any) -> Any:
+    # file-backed inputs are mapped when the product is built
+    if is_resource_config(value):
+        return ResourceRef.of(value.get("resource"))
+    return plain_value(value)
+
+
+def coerce_value(value: Any, annotation: Any) -> Any:
+    if annotation is bool and isinstance(value, str):
+        if value.lower() in ("true", "yes", "on", "1"):
+            return True
+        if value.lower() in ("false", "no", "off", "0"):
+            return False
+        raise ValueError(f"can not coerce {value!r} to bool")
+    if annotation in (int, float, str, bool) and not isinstance(value, annotation):
+        return annotation(value)
+    return value
+
+
+class KwargsPlan:
+    """Constructor signature of a configurable class, analyzed once per class."""
+
+    __slots__ = ("cls", "params", "required", "var_kwargs")
+
+    cls: type
+    # (name, annotation, has_default) of every parameter passable by keyword
+    params: Tuple[Tuple[str, Any, bool], ...]
+    required: FrozenSet[str]
+    var_kwargs: bool
+
+    _plans: Dict[type, "KwargsPlan"] = {}
+    _plans_lock = threading.Lock()
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        signature = inspect.signature(cls)
+        try:
+            hints = typing.get_type_hints(cls.__init__)  # type: ignore
+        except Exception:
+            hints = {}
+
+        params: List[Tuple[str, Any, bool]] = []
+        required = set()
+        var_kwargs = False
+        for parameter in signature.parameters.values():
+            if parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                var_kwargs = True
+                continue
+            if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+                continue
+            has_default = parameter.default is not inspect.Parameter.empty
+            if parameter.kind == inspect.Parameter.POSITIONAL_ONLY:
+                if not has_default:
+                    required.add(parameter.name)
+                continue
+            annotation = hints.get(parameter.name, parameter.annotation)
+            params.append((parameter.name, annotation, has_default))
+            if not has_default:
+                required.add(parameter.name)
+        self.params = tuple(params)
+        self.required = frozenset(required)
+        self.var_kwargs = var_kwargs
+
+    @staticmethod
+    def of(cls: type) -> "KwargsPlan":
+        plan = KwargsPlan._plans.get(cls)
+        if plan is None:
+            with KwargsPlan._plans_lock:
+                plan = KwargsPlan._plans.get(cls)
+                if plan is None:
+                    plan = KwargsPlan(cls)
+                    KwargsPlan._plans[cls] = plan
+        return plan
+
+    def extract(
+        self,
+        config: Optional["ConfigTree"],
+        key: Any = None,
+        coerce_types: bool = False,
+        excluded_keys: FrozenSet[str] = frozenset(),
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
+        if config is not None:
+            for name, annotation, _ in self.params:
+                value = config.get(name, _MISSING)
+                if value is _MISSING:
+                    continue
+                value = config_value(value)
+                if (
+                    coerce_types
+                    and annotation is not inspect.Parameter.empty
+                    and not isinstance(value, ResourceRef)
+                ):
+                    try:
+                        value = coerce_value(value, annotation)
+                    except (TypeError, ValueError) as e:
+                        raise InjectorException(
+                            f"config {key} of {self.cls} has invalid value for "
+                            + f"'{name}': {e}"
+                        )
+                kwargs[name] = value
+
+            if self.var_kwargs:
+                for config_key, value in config.items():
+                    name = config_key.strip('"')
+                    if (
+                        name in kwargs
+                        or name in RESERVED_CONFIG_KEYS
+                        or name in excluded_keys
+                    ):
+                        continue
+                    kwargs[name] = config_value(value)
+
+        missing = self.required.difference(kwargs)
+        if missing:
+            raise InjectorException(
+                f"config {key} of {self.cls} does not provide required "
+                + f"arguments: {', '.join(sorted(missing))}"
+            )
+        return kwargs
@@ -0,0 +1,120 @@
+import threading
+from collections import OrderedDict
+from typing import (TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple,
+                    Type)
+
+import inject
+
+from pyspring.decorators import ConfigurableComponentData
+from pyspring.scope import Scope
+
+if TYPE_CHECKING:
+    from pyhocon import ConfigTree
+
+    from pyspring.auto import AutoBinder
+
+
+class LazyProvider:
+    """Binding of a table key, a single small object per key until first use."""
+
+    __slots__ = ("table", "key")
+
+    table: "LazyBindingTable"
+    key: Any
+
+    def __init__(self, table: "LazyBindingTable", key: Any) -> None:
+        self.table = table
+        self.key = key
+
+    def __call__(self) -> Any:
+        return self.table.get(self.key)
+
+
+class LazyBindingTable:
+    """Index of configured components whose holders are built on first use.
+
+    Startup only records ``key -> (template, config entry)``, the entry being
+    a reference to its subtree of the parsed config; the rest of the tree is
+    released after binding. kwargs, injectors and holders are materialized on
+    first resolution, so startup skips building them. With
+    ``max_holders`` the least recently used holders are dropped and rebuilt on
+    demand, so evicted singletons are constructed again.
+    """
+
+    entries: Dict[Any, Tuple[ConfigurableComponentData, "ConfigTree"]]
+    providers: "OrderedDict[Any, inject.Provider]"
+    max_holders: Optional[int]
+    auto_binder: Optional["AutoBinder"]
+
+    def __init__(
+        self,
+        config_entries: Iterable[Tuple[ConfigurableComponentData, "ConfigTree"]],
+        max_holders: Optional[int] = None,
+    ) -> None:
+        self.entries = {}
+        for template, config in config_entries:
+            key = config.get("key", None) or template.product_cls
+            self.entries[key] = (template, config)
+        self.providers = OrderedDict()
+        self.max_holders = max_holders
+        self.auto_binder = None
+        self.lock = threading.RLock()
+        self.materialized_count = 0
+        self.evicted_count = 0
+
+    def keys(self) -> List[Any]:
+        return list(self.entries)
+
+    def get_product_type(self, key: Any) -> Type[Any]:
+        return self.entries[key][0].get_product_type()
+
+    def get_scope(self, key: Any) -> Scope:
+        template, config = self.entries[key]
+        scope = config.get("scope", None)
+        if scope is not None:
+            return Scope[scope]
+        return template.scope or Scope.singleton
+
+    def provider(self, key: Any) -> inject.Provider:
+        return LazyProvider(self, key)
+
+    def get(self, key: Any) -> Any:
+        provider = self.providers.get(key)
+        if provider is None:
+            provider = self.materialize(key)
+        elif self.max_holders is not None:
+            with self.lock:
+                if key in self.providers:
+                    self.providers.move_to_end(key)
+        return provider()
+
+    def materialize(self, key: Any) -> inject.Provider:
+        with self.lock:
+            provider = self.providers.get(key)
+            if provider is not None:
+                return provider
+            assert self.auto_binder is not None, "table is not bound yet"
+            template, config = self.entries[key]
+            provider = self.auto_binder.create_configurable_component_provider(
+                template.with_config(config)
+            )
+            self.providers[key] = provider
+            self.materialized_count += 1
+            if self.max_holders is not None:
+                while len(self.providers) > self.max_holders:
+                    self.providers.popitem(last=False)
+                    self.evicted_count += 1
+            return provider
+
+    def remove(self, key: Any) -> None:
+        with self.lock:
+            if self.entries.pop(key, None) is not None:
+                self.providers.pop(key, None)
+
+    def evict(self, key: Optional[Any] = None) -> None:
+        with self.lock:
+            if key is None:
+                self.evicted_count += len(self.providers)
+                self.providers.clear()
+            elif self.providers.pop(key, None) is not None:
+                self.evicted_count += 1
@@ -0,0 +1,146 @@
+import threading
+from contextlib import contextmanager
+from threading import get_ident
+from typing import Any, Dict, Iterator, List, Optional
+
+from inject import InjectorException
+
+
+class CircularDependencyError(InjectorException):
+    pass
+
+
+class DeadlockError(InjectorException):
+    pass
+
+
+# wait-for graph: thread ident -> the lock it blocks on
+_WAITING: Dict[int, "InitLock"] = {}
+# thread ident -> init locks it holds, in acquisition order (its resolution chain)
+_HELD: Dict[int, List["InitLock"]] = {}
+_GRAPH_LOCK = threading.Lock()
+
+
+def describe_chain(ident: int) -> str:
+    return " -> ".join(repr(lock.label) for lock in _HELD.get(ident, ())) or "nothing"
+
+
+def find_cycle(ident: int, lock: "InitLock") -> Optional[List[int]]:
+    # follows lock -> owner -> lock the owner waits for, back to ``ident``
+    threads = [ident]
+    while True:
+        owner = lock.owner
+        if owner is None or owner in threads[1:]:
+            return None
+        if owner == ident:
+            return threads
+        threads.append(owner)
+        next_lock = _WAITING.get(owner)
+        if next_lock is None:
+            return None
+        lock = next_lock
+
+
+def deadlock_message(threads: List[int]) -> str:
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    lines = ["deadlock while initializing beans, resolution chains:"]
+    for ident in threads:
+        waiting = _WAITING[ident]
+        lines.append(
+            f"  thread {names.get(ident, ident)!r} holds {describe_chain(ident)}, "
+            + f"waits for {waiting.label!r} held by "
+            + f"{names.get(waiting.owner, waiting.owner)!r}"  # type: ignore
+        )
+    return "\n".join(lines)
+
+
+class InitLock:
+    """Lock held while a holder runs user code to build its product.
+
+    Acquisitions are tracked per thread: re-entering a non-reentrant lock
+    raises ``CircularDependencyError``, and blocking on a lock whose owner
+    (transitively) waits for the current thread raises ``DeadlockError``
+    instead of hanging. The wait-for graph is only touched when a thread
+    would block, so uncontended builds pay for a few attribute stores.
+    """
+
+    __slots__ = ("label", "reentrant", "lock", "owner", "count")
+
+    label: Any
+    reentrant: bool
+    lock: threading.Lock
+    owner: Optional[int]
+    count: int
+
+    def __init__(self, label: Any = None, reentrant: bool = False) -> None:
+        self.label = label
+        self.reentrant = reentrant
+        self.lock = threading.Lock()
+        self.owner = None
+        self.count = 0
+
+    def acquire(self) -> bool:
+        ident = get_ident()
+        if self.owner == ident:
+            if not self.reentrant:
+                raise CircularDependencyError(
+                    f"circular dependency: {describe_chain(ident)} -> {self.label!r}"
+                )
+            self.count += 1
+            return True
+        if not self.lock.acquire(False):
+            self.wait(ident)
+        self.owner = ident
+        self.count = 1
+        held = _HELD.get(ident)
+        if held is None:
+            held = _HELD.setdefault(ident, [])
+        held.append(self)
+        return True
+
+    def wait(self, ident: int) -> None:
+        with _GRAPH_LOCK:
+            _WAITING[ident] = self
+            threads = find_cycle(ident, self)
+            if threads is not None:
+                message = deadlock_message(threads)
+                del _WAITING[ident]
+                raise DeadlockError(message)
+        try:
+            self.lock.acquire()
+        finally:
+            with _GRAPH_LOCK:
+                del _WAITING[ident]
+
+    def release(self) -> None:
+        self.count -= 1
+        if self.count == 0:
+            _HELD[get_ident()].remove(self)
+            self.owner = None
+            self.lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return f"<InitLock {self.label!r}>"
+
+
+@contextmanager
+def waiting_for(lock: InitLock) -> Iterator[None]:
+    """Record the current thread as blocked on ``lock`` while it waits otherwise.
+
+    Lets a thread waiting on a future for a build that holds ``lock`` show up
+    in the wait-for graph, so the build blocking on it raises ``DeadlockError``.
+    """
+    ident = get_ident()
+    with _GRAPH_LOCK:
+        _WAITING[ident] = lock
+    try:
+        yield
+    finally:
+        with _GRAPH_LOCK:
+            del _WAITING[ident]
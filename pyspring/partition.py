@@ -0,0 +1,234 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import inject
+from inject import Binding, Constructor, Injectable
+
+from pyspring.auto import AutoBinder
+from pyspring.background import BackgroundInitializer, ContextExecutor
+from pyspring.conditions import Environment
+from pyspring.decorators import ConfigurableComponentData, DecoratorData
+from pyspring.injector import EnhancementInjector
+from pyspring.registry import BindingKeyMap
+from pyspring.scaner import (flatten_config_with_decorator_data, merge_paths,
+                             scan_all,
+                             split_configurable_component_scan_results)
+
+
+class Partition:
+    name: str
+    bindings: Dict[Binding, Constructor]
+    last_used: float
+    background_initializer: Optional[BackgroundInitializer]
+
+    def __init__(self, name: str, bindings: Dict[Binding, Constructor]) -> None:
+        self.name = name
+        self.bindings = bindings
+        self.last_used = time.monotonic()
+        self.background_initializer = None
+
+    def context(self) -> contextvars.Context:
+        """A copy of the current context with this partition active."""
+        context = contextvars.copy_context()
+        context.run(_ACTIVE_PARTITION.set, self)
+        return context
+
+
+_ACTIVE_PARTITION: "contextvars.ContextVar[Optional[Partition]]" = (
+    contextvars.ContextVar("pyspring_active_partition", default=None)
+)
+
+
+class PartitionedInjector(EnhancementInjector):
+    def get_instance(self, cls: Binding) -> Injectable:  # type: ignore
+        partition = _ACTIVE_PARTITION.get()
+        if partition is None:
+            return super().get_instance(cls)
+
+        binding = partition.bindings.get(cls)
+        if binding:
+            return binding()
+
+        # shared bindings are built without the partition, so parent singletons
+        # never capture partition-specific dependencies
+        token = _ACTIVE_PARTITION.set(None)
+        try:
+            return super().get_instance(cls)
+        finally:
+            _ACTIVE_PARTITION.reset(token)
+
+    def try_instance(self, cls: Binding, default: Any = None) -> Any:
+        partition = _ACTIVE_PARTITION.get()
+        if partition is None:
+            return super().try_instance(cls, default)
+
+        binding = partition.bindings.get(cls)
+        if binding:
+            return binding()
+
+        token = _ACTIVE_PARTITION.set(None)
+        try:
+            return super().try_instance(cls, default)
+        finally:
+            _ACTIVE_PARTITION.reset(token)
+
+
+class PartitionedContainer:
+    """Parent container plus named partitions bound from per-tenant configs.
+
+    Modules are scanned once; each partition only flattens its own config files
+    against the scanned templates and binds the configured components. Keys are
+    resolved partition-first, then from the parent. With ``idle_ttl``,
+    partitions unused for that many seconds are evicted on creation and, at
+    most every ``check_interval`` seconds, on access.
+    """
+
+    injector: PartitionedInjector
+    auto_binder: AutoBinder
+    configurable_templates: List[ConfigurableComponentData]
+    partitions: Dict[str, Partition]
+    idle_ttl: Optional[float]
+    check_interval: float
+    last_check: float
+    profiles: Optional[List[str]]
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+        config_path: Optional[str] = None,
+        config_paths: Optional[List[str]] = None,
+        bind_in_runtime: bool = True,
+        idle_ttl: Optional[float] = None,
+        packages: Optional[List[str]] = None,
+        entry_point_group: Optional[str] = None,
+        profiles: Optional[List[str]] = None,
+        check_interval: float = 1.0,
+    ) -> None:
+        _config_paths = merge_paths(config_path, config_paths)
+        environment = Environment(profiles, _config_paths)
+        (
+            self.configurable_templates,
+            other_scan_results,
+        ) = split_configurable_component_scan_results(
+            scan_all(path, paths, packages, entry_point_group, environment)
+        )
+        decorator_data_list: List[DecoratorData] = other_scan_results
+        decorator_data_list.extend(
+            flatten_config_with_decorator_data(
+                self.configurable_templates,
+                _config_paths,
+                environment=environment,
+            )
+        )
+        self.auto_binder = AutoBinder(decorator_data_list)
+        self.injector = PartitionedInjector(
+            self.auto_binder.auto_bind, bind_in_runtime=bind_in_runtime
+        )
+        self.partitions = {}
+        self.idle_ttl = idle_ttl
+        self.check_interval = check_interval
+        self.last_check = time.monotonic()
+        self.profiles = profiles
+        self.lock = threading.RLock()
+
+    def install(self) -> "PartitionedContainer":
+        with inject._INJECTOR_LOCK:
+            inject._INJECTOR = self.injector
+        self.auto_binder.background_initializer.start()
+        with self.lock:
+            partitions = list(self.partitions.values())
+        for partition in partitions:
+            if partition.background_initializer is not None:
+                partition.background_initializer.start()
+        return self
+
+    def create_partition(
+        self,
+        name: str,
+        config_path: Optional[str] = None,
+        config_paths: Optional[List[str]] = None,
+    ) -> Partition:
+        self.evict_idle()
+        _config_paths = merge_paths(config_path, config_paths)
+        decorator_data_list = flatten_config_with_decorator_data(
+            self.configurable_templates,
+            _config_paths,
+            environment=Environment(self.profiles, _config_paths),
+        )
+        partition = Partition(name, {})
+        container_initializer = self.auto_binder.background_initializer
+        # background, prefetch and refresh work runs on the container's threads,
+        # with the partition active
+        partition.background_initializer = BackgroundInitializer(
+            ContextExecutor(container_initializer.get_executor, partition.context)
+        )
+        auto_binder = AutoBinder(
+            decorator_data_list,  # type: ignore
+            binding_key_map=BindingKeyMap(parent=self.auto_binder.binding_key_map),
+            # soft singletons of every partition share the container budget
+            soft_registry=self.auto_binder.soft_registry,
+            background_initializer=partition.background_initializer,
+            init_watchdog=self.auto_binder.init_watchdog,
+            partition=name,
+        )
+        binder = inject.Binder()
+        auto_binder.auto_bind(binder)
+        partition.bindings = binder._bindings
+        with self.lock:
+            self.partitions[name] = partition
+        if container_initializer.started:
+            partition.background_initializer.start()
+        return partition
+
+    def get_partition(self, name: str) -> Partition:
+        partition = self.partitions.get(name)
+        if partition is None:
+            raise KeyError(f"partition {name} is not created")
+        now = time.monotonic()
+        partition.last_used = now
+        if self.idle_ttl is not None and now - self.last_check >= self.check_interval:
+            self.evict_idle()
+        return partition
+
+    @contextmanager
+    def partition(self, name: str) -> Iterator[Partition]:
+        partition = self.get_partition(name)
+        partition.last_used = time.monotonic()
+        token = _ACTIVE_PARTITION.set(partition)
+        try:
+            yield partition
+        finally:
+            _ACTIVE_PARTITION.reset(token)
+            partition.last_used = time.monotonic()
+
+    def instance(self, name: str, cls: Binding) -> Any:
+        with self.partition(name):
+            return self.injector.get_instance(cls)
+
+    def evict(self, name: str) -> bool:
+        with self.lock:
+            evicted = self.partitions.pop(name, None) is not None
+        if evicted:
+            self.auto_binder.soft_registry.unregister_partition(name)
+        return evicted
+
+    def evict_idle(self) -> List[str]:
+        if self.idle_ttl is None:
+            return []
+        self.last_check = time.monotonic()
+        deadline = self.last_check - self.idle_ttl
+        with self.lock:
+            evicted = [
+                name
+                for name, partition in self.partitions.items()
+                if partition.last_used < deadline
+            ]
+            for name in evicted:
+                del self.partitions[name]
+        for name in evicted:
+            self.auto_binder.soft_registry.unregister_partition(name)
+        return evicted
@@ -0,0 +1,188 @@
+import hashlib
+import inspect
+import logging
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Optional
+
+from pyspring.cache import freeze
+from pyspring.resource import ResourceRef, has_resources
+
+logger = logging.getLogger("pyspring")
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pyspring")
+
+
+class BaseCodec(ABC):
+    """Writes a product into a snapshot directory and reads it back."""
+
+    @abstractmethod
+    def dump(self, product: Any, directory: str) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def load(self, directory: str) -> Any:
+        raise NotImplementedError()
+
+
+class PickleCodec(BaseCodec):
+    """Pickle protocol 5, with out-of-band buffers stored as separate files.
+
+    Buffers of at least ``mmap_threshold`` bytes are memory-mapped read-only on
+    load, so arrays that support out-of-band pickling (numpy, arrow) are backed
+    by the page cache instead of being copied.
+    """
+
+    mmap_threshold: int
+
+    def __init__(self, mmap_threshold: int = 1 << 20) -> None:
+        self.mmap_threshold = mmap_threshold
+
+    def dump(self, product: Any, directory: str) -> None:
+        buffers: List[pickle.PickleBuffer] = []
+        with open(os.path.join(directory, "product.pkl"), "wb") as f:
+            pickle.dump(product, f, protocol=5, buffer_callback=buffers.append)
+        for i, buffer in enumerate(buffers):
+            with open(os.path.join(directory, f"buffer-{i}.bin"), "wb") as f:
+                f.write(buffer.raw())
+
+    def read_buffer(self, path: str) -> Any:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            if size < self.mmap_threshold or size == 0:
+                return bytearray(f.read())
+            # the mapping stays valid after the file is closed
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def load(self, directory: str) -> Any:
+        buffers: List[Any] = []
+        while True:
+            path = os.path.join(directory, f"buffer-{len(buffers)}.bin")
+            if not os.path.exists(path):
+                break
+            buffers.append(self.read_buffer(path))
+        with open(os.path.join(directory, "product.pkl"), "rb") as f:
+            return pickle.load(f, buffers=buffers)
+
+
+class PersistOptions:
+    cache_dir: str
+    version: Optional[str]
+    codec: BaseCodec
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        version: Optional[str] = None,
+        codec: Optional[BaseCodec] = None,
+    ) -> None:
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.version = version
+        self.codec = codec or PickleCodec()
+
+
+def code_version(init_func: Any) -> str:
+    try:
+        source = inspect.getsource(init_func)
+    except (OSError, TypeError):
+        return ""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def versioned_params(params: Any) -> Any:
+    # a mapped file changes without its declaration, so it versions by its stat
+    if isinstance(params, dict) and has_resources(params):
+        return {
+            name: value.file_identity() if isinstance(value, ResourceRef) else value
+            for name, value in params.items()
+        }
+    return params
+
+
+def snapshot_digest(
+    key: Any, init_func: Any, params: Any, options: PersistOptions
+) -> str:
+    identity = (
+        repr(key),
+        f"{getattr(init_func, '__module__', '')}."
+        + f"{getattr(init_func, '__qualname__', repr(init_func))}",
+        repr(freeze(versioned_params(params))),
+        code_version(init_func),
+        options.version or "",
+    )
+    return hashlib.sha256(repr(identity).encode()).hexdigest()
+
+
+class PersistedInitFunc:
+    """Wraps an init func, restoring its product from a snapshot when one exists.
+
+    Snapshots are keyed on the binding key, the init func and its source, the
+    params (config subtree, mapped resources by size, mtime and inode) and
+    ``PersistOptions.version``; a changed input writes a new snapshot instead
+    of reusing a stale one.
+    """
+
+    __slots__ = ("init_func", "directory", "codec")
+
+    init_func: Callable[..., Any]
+    directory: str
+    codec: BaseCodec
+
+    def __init__(
+        self,
+        init_func: Callable[..., Any],
+        key: Any,
+        params: Any,
+        options: PersistOptions,
+        origin: Optional[Any] = None,
+    ) -> None:
+        # origin is the class or function whose source versions the snapshot
+        self.init_func = init_func
+        self.directory = os.path.join(
+            options.cache_dir,
+            snapshot_digest(
+                key, origin if origin is not None else init_func, params, options
+            ),
+        )
+        self.codec = options.codec
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if os.path.isdir(self.directory):
+            try:
+                return self.codec.load(self.directory)
+            except Exception:
+                logger.warning(
+                    "can not restore snapshot %s, rebuilding",
+                    self.directory,
+                    exc_info=True,
+                )
+                shutil.rmtree(self.directory, ignore_errors=True)
+        product = self.init_func(*args, **kwargs)
+        self.store(product)
+        return product
+
+    def store(self, product: Any) -> None:
+        parent = os.path.dirname(self.directory)
+        try:
+            os.makedirs(parent, exist_ok=True)
+            tmp_directory = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+        except OSError:
+            logger.warning("can not create snapshot dir in %s", parent, exc_info=True)
+            return
+        try:
+            self.codec.dump(product, tmp_directory)
+            # readers only ever see complete snapshots
+            os.rename(tmp_directory, self.directory)
+        except Exception:
+            if not os.path.isdir(self.directory):
+                logger.warning(
+                    "can not snapshot %r to %s",
+                    self.init_func,
+                    self.directory,
+                    exc_info=True,
+                )
+            shutil.rmtree(tmp_directory, ignore_errors=True)
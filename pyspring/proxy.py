@@ -0,0 +1,121 @@
+import threading
+from typing import Any, Type, TypeVar, Union
+
+import inject
+
+V = TypeVar("V")
+
+_UNRESOLVED: Any = object()
+
+
+class LazyProxy:
+    """Stands in for a binding key, resolving it on first use.
+
+    Attribute access, calls and the common protocols (iteration, indexing,
+    comparison, context managers, ``isinstance``) are forwarded to the target.
+    The key is resolved once per proxy; after that forwarding is a single
+    attribute lookup on the cached target.
+    """
+
+    __slots__ = ("_pyspring_key", "_pyspring_target", "_pyspring_lock")
+
+    def __init__(self, key: Any) -> None:
+        object.__setattr__(self, "_pyspring_key", key)
+        object.__setattr__(self, "_pyspring_target", _UNRESOLVED)
+        object.__setattr__(self, "_pyspring_lock", threading.Lock())
+
+    def _pyspring_resolve(self) -> Any:
+        target = object.__getattribute__(self, "_pyspring_target")
+        if target is _UNRESOLVED:
+            with object.__getattribute__(self, "_pyspring_lock"):
+                target = object.__getattribute__(self, "_pyspring_target")
+                if target is _UNRESOLVED:
+                    target = inject.instance(
+                        object.__getattribute__(self, "_pyspring_key")
+                    )
+                    object.__setattr__(self, "_pyspring_target", target)
+        return target
+
+    def _pyspring_resolved(self) -> bool:
+        return object.__getattribute__(self, "_pyspring_target") is not _UNRESOLVED
+
+    @property  # type: ignore
+    def __class__(self) -> type:
+        return type(self._pyspring_resolve())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pyspring_resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._pyspring_resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._pyspring_resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._pyspring_resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        if not self._pyspring_resolved():
+            key = object.__getattribute__(self, "_pyspring_key")
+            return f"<LazyProxy {key!r} (unresolved)>"
+        return repr(self._pyspring_resolve())
+
+    def __str__(self) -> str:
+        return str(self._pyspring_resolve())
+
+    def __bool__(self) -> bool:
+        return bool(self._pyspring_resolve())
+
+    def __len__(self) -> int:
+        return len(self._pyspring_resolve())
+
+    def __iter__(self) -> Any:
+        return iter(self._pyspring_resolve())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._pyspring_resolve()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._pyspring_resolve()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._pyspring_resolve()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self._pyspring_resolve()[key]
+
+    def __eq__(self, other: Any) -> bool:
+        return self._pyspring_resolve() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return self._pyspring_resolve() != other
+
+    def __lt__(self, other: Any) -> bool:
+        return self._pyspring_resolve() < other
+
+    def __le__(self, other: Any) -> bool:
+        return self._pyspring_resolve() <= other
+
+    def __gt__(self, other: Any) -> bool:
+        return self._pyspring_resolve() > other
+
+    def __ge__(self, other: Any) -> bool:
+        return self._pyspring_resolve() >= other
+
+    def __hash__(self) -> int:
+        return hash(self._pyspring_resolve())
+
+    def __enter__(self) -> Any:
+        return self._pyspring_resolve().__enter__()
+
+    def __exit__(self, *exc_info: Any) -> Any:
+        return self._pyspring_resolve().__exit__(*exc_info)
+
+
+def inject_lazy(key: Union[Type[V], Any]) -> V:
+    """Return a proxy for ``key`` that is resolved on first use.
+
+    Works as a class attribute (like ``inject.attr``) and inside constructors.
+    """
+    return LazyProxy(key)  # type: ignore
@@ -1,6 +1,9 @@
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Any, Dict, Generic, List, Set, Type, TypeVar
+from types import MappingProxyType
+from typing import (Any, Dict, Generic, List, Mapping, Optional, Set, Tuple,
+                    Type, TypeVar)
 
 import inject
 
@@ -17,19 +20,166 @@ class BaseRegistry(ABC, Generic[V]):
         raise NotImplementedError()
 
 
+class BeanCollection(Generic[V]):
+    """Members bound under one base type, in binding order.
+
+    The key set is fixed when the collection is created. Stable members
+    (singletons) are resolved once, and when every member is stable the whole
+    snapshot is kept as an immutable tuple; other members are resolved on
+    every access.
+    """
+
+    __slots__ = ("keys", "stable_keys", "stable_values", "snapshot", "lock")
+
+    keys: Tuple[Any, ...]
+    stable_keys: Tuple[Any, ...]
+    stable_values: Optional[Dict[Any, V]]
+    snapshot: Optional[Tuple[Tuple[Any, V], ...]]
+
+    def __init__(self, keys: Tuple[Any, ...], stable_keys: Tuple[Any, ...]) -> None:
+        self.keys = keys
+        self.stable_keys = stable_keys
+        self.stable_values = None
+        self.snapshot = None
+        self.lock = threading.Lock()
+
+    def resolve_stable(self) -> Dict[Any, V]:
+        # members are built outside the lock, under their holders' init locks;
+        # singletons resolve to the same instances, so the first result wins
+        stable_values = {key: inject.instance(key) for key in self.stable_keys}
+        with self.lock:
+            if self.stable_values is None:
+                self.stable_values = stable_values
+            return self.stable_values
+
+    def items(self) -> Tuple[Tuple[Any, V], ...]:
+        snapshot = self.snapshot
+        if snapshot is not None:
+            return snapshot
+        stable_values = self.stable_values
+        if stable_values is None:
+            stable_values = self.resolve_stable()
+        items = tuple(
+            (key, stable_values[key])
+            if key in stable_values
+            else (key, inject.instance(key))
+            for key in self.keys
+        )
+        if len(stable_values) == len(self.keys):
+            self.snapshot = items
+        return items
+
+    def values(self) -> Tuple[V, ...]:
+        return tuple(value for _, value in self.items())
+
+    def as_map(self) -> Mapping[Any, V]:
+        return MappingProxyType(dict(self.items()))
+
+
 class BindingKeyMap:
-    binding_key_map: Dict[Type[Any], Set[Any]] = defaultdict(set)
+    binding_key_map: Dict[Type[Any], Set[Any]]
+    parent: Optional["BindingKeyMap"]
+
+    # key -> bound type in binding order, and keys whose instance never changes
+    key_types: Dict[Any, Type[Any]]
+    stable_keys: Set[Any]
+    collections: Dict[Type[Any], BeanCollection]
+
+    def __init__(self, parent: Optional["BindingKeyMap"] = None) -> None:
+        self.binding_key_map = defaultdict(set)
+        self.parent = parent
+        self.key_types = {}
+        self.stable_keys = set()
+        self.collections = {}
+        self.lock = threading.RLock()
 
-    def add(self, value_type: Type[Any], key: Any) -> None:
-        self.binding_key_map[value_type].add(key)
+    def add(self, value_type: Type[Any], key: Any, stable: bool = False) -> None:
+        with self.lock:
+            self.binding_key_map[value_type].add(key)
+            self.key_types[key] = value_type
+            if stable:
+                self.stable_keys.add(key)
+            else:
+                self.stable_keys.discard(key)
+            # collections built before this binding are dropped, not patched
+            self.collections = {}
+
+    def remove(self, key: Any) -> None:
+        with self.lock:
+            value_type = self.key_types.pop(key, None)
+            if value_type is None:
+                return
+            self.binding_key_map[value_type].discard(key)
+            self.stable_keys.discard(key)
+            self.collections = {}
 
     def get(self, value_type: Type[Any]) -> Set[Any]:
-        result_keys = set()
-        for vt, ks in self.binding_key_map.items():
+        return set(self.keys_of(value_type))
+
+    def keys_of(self, value_type: Type[Any]) -> Tuple[Any, ...]:
+        return self.collection(value_type).keys
+
+    def is_stable(self, key: Any) -> bool:
+        if key in self.key_types:
+            return key in self.stable_keys
+        return self.parent is not None and self.parent.is_stable(key)
+
+    def collection(self, value_type: Type[Any]) -> BeanCollection:
+        collection = self.collections.get(value_type)
+        if collection is None:
+            with self.lock:
+                collection = self.collections.get(value_type)
+                if collection is None:
+                    collection = self.create_collection(value_type)
+                    self.collections = {**self.collections, value_type: collection}
+        return collection
+
+    def create_collection(self, value_type: Type[Any]) -> BeanCollection:
+        keys: Dict[Any, None] = {}
+        for key, vt in self.key_types.items():
             # check if value_type is subclass of vt and key_type is subclass of kt
             if issubclass(vt, value_type) or vt == value_type:
-                result_keys.update(ks)
-        return result_keys
+                keys[key] = None
+        if self.parent is not None:
+            for key in self.parent.keys_of(value_type):
+                keys.setdefault(key, None)
+        return BeanCollection(
+            tuple(keys), tuple(key for key in keys if self.is_stable(key))
+        )
+
+
+def inject_all(value_type: Type[V]) -> Tuple[V, ...]:
+    """Return every instance bound under ``value_type``, in binding order."""
+    return inject.instance(BindingKeyMap).collection(value_type).values()
+
+
+def inject_map(value_type: Type[V]) -> Mapping[Any, V]:
+    """Return ``{key: instance}`` for every binding under ``value_type``."""
+    return inject.instance(BindingKeyMap).collection(value_type).as_map()
+
+
+class _AllAttributeInjection:
+    def __init__(self, value_type: Type[Any]) -> None:
+        self._value_type = value_type
+
+    def __get__(self, obj: Any, owner: Any) -> Tuple[Any, ...]:
+        return inject_all(self._value_type)
+
+
+class _MapAttributeInjection:
+    def __init__(self, value_type: Type[Any]) -> None:
+        self._value_type = value_type
+
+    def __get__(self, obj: Any, owner: Any) -> Mapping[Any, Any]:
+        return inject_map(self._value_type)
+
+
+def inject_all_attr(value_type: Type[V]) -> Tuple[V, ...]:
+    return _AllAttributeInjection(value_type)  # type: ignore
+
+
+def inject_map_attr(value_type: Type[V]) -> Mapping[Any, V]:
+    return _MapAttributeInjection(value_type)  # type: ignore
 
 
 class InjectedRegistry(BaseRegistry[V]):
@@ -49,7 +199,7 @@ class InjectedRegistry(BaseRegistry[V]):
 
     def get_keys(self) -> List[Any]:
         value_type = self.get_type
-        return list(self.binding_key_map.get(value_type))
+        return list(self.binding_key_map.keys_of(value_type))
 
     def get(self, key: Any) -> V:
         return inject.instance(key)  # type: ignore
@@ -0,0 +1,136 @@
+import mmap
+import os
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from inject import InjectorException
+
+
+def load_raw(path: str) -> memoryview:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        # the mapping stays valid after the file is closed
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def load_npy(path: str) -> Any:
+    import numpy
+
+    return numpy.load(path, mmap_mode="r")
+
+
+def load_arrow(path: str) -> Any:
+    import pyarrow
+
+    # arrow IPC / feather v2 files, columns reference the mapping without copies
+    return pyarrow.ipc.open_file(pyarrow.memory_map(path, "r")).read_all()
+
+
+# format -> loader, returning a read-only view backed by the page cache
+RESOURCE_LOADERS: Dict[str, Callable[[str], Any]] = {
+    "raw": load_raw,
+    "npy": load_npy,
+    "arrow": load_arrow,
+}
+
+_RESOURCES: Dict[Tuple[str, str], Any] = {}
+_RESOURCES_LOCK = threading.Lock()
+
+
+def load_resource(path: str, format: str = "raw") -> Any:
+    """Map a read-only data file, once per process and (path, format)."""
+    path = os.path.abspath(os.path.expanduser(path))
+    resource_key = (path, format)
+    resource = _RESOURCES.get(resource_key)
+    if resource is None:
+        loader = RESOURCE_LOADERS.get(format)
+        if loader is None:
+            raise InjectorException(
+                f"unknown resource format {format!r} for {path}, expected one of "
+                + ", ".join(RESOURCE_LOADERS)
+            )
+        with _RESOURCES_LOCK:
+            resource = _RESOURCES.get(resource_key)
+            if resource is None:
+                resource = loader(path)
+                _RESOURCES[resource_key] = resource
+    return resource
+
+
+class ResourceRef:
+    """A ``resource: {path, format}`` config value, mapped when the bean is built.
+
+    Refs compare and hash by declaration, so cache keys never read the file.
+    Persisted snapshot digests use ``file_identity()``, so they change with it.
+    """
+
+    __slots__ = ("path", "format")
+
+    path: str
+    format: str
+
+    def __init__(self, path: str, format: str = "raw") -> None:
+        self.path = path
+        self.format = format
+
+    @staticmethod
+    def of(config: Any) -> "ResourceRef":
+        if isinstance(config, str):
+            return ResourceRef(config)
+        return ResourceRef(config["path"], config.get("format", "raw"))
+
+    def load(self) -> Any:
+        return load_resource(self.path, self.format)
+
+    def file_identity(self) -> Tuple[str, str, int, int, int]:
+        """Path and format plus the file's size, mtime and inode."""
+        path = os.path.abspath(os.path.expanduser(self.path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return (path, self.format, -1, -1, -1)
+        return (path, self.format, stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, ResourceRef)
+            and self.path == other.path
+            and self.format == other.format
+        )
+
+    def __hash__(self) -> int:
+        return hash((ResourceRef, self.path, self.format))
+
+    def __repr__(self) -> str:
+        return f"ResourceRef({self.path!r}, {self.format!r})"
+
+
+def is_resource_config(value: Any) -> bool:
+    from pyhocon import ConfigTree
+
+    return isinstance(value, ConfigTree) and "resource" in value
+
+
+def has_resources(kwargs: Dict[str, Any]) -> bool:
+    return any(isinstance(value, ResourceRef) for value in kwargs.values())
+
+
+class ResourceInitFunc:
+    """Wraps an init func, passing mapped resources in place of their refs."""
+
+    __slots__ = ("init_func",)
+
+    init_func: Callable[..., Any]
+
+    def __init__(self, init_func: Callable[..., Any]) -> None:
+        self.init_func = init_func
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        for name, value in kwargs.items():
+            if isinstance(value, ResourceRef):
+                kwargs[name] = value.load()
+        return self.init_func(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<resources of {self.init_func!r}>"
@@ -1,45 +1,135 @@
+import glob
 import importlib
+import importlib.util
 import inspect
+import logging
 import os
+import pkgutil
 import sys
-from typing import Any, List, Optional, Tuple
-
-from pyhocon import ConfigFactory, ConfigList, ConfigTree
+import time
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
+from pyspring.conditions import Environment, matches_conditions
 from pyspring.decorators import (BeanData, ComponentData,
                                  ConfigurableComponentData, ConfigurationData,
                                  DecoratorData, DecoratorType)
 
+if TYPE_CHECKING:
+    from pyhocon import ConfigTree
+
+
+DEFAULT_ENTRY_POINT_GROUP = "pyspring.beans"
+
+logger = logging.getLogger("pyspring")
+
+
+def scan_object(obj: Any) -> List[DecoratorData]:
+    """Decorator data of a module, a decorated class or a bean function."""
+    if isinstance(obj, ModuleType):
+        return scan_module(obj)
+    scan_results: List[Any] = []
+    binding_type = getattr(obj, "__binding__", None)
+    if binding_type is None:
+        return scan_results
+    if inspect.isfunction(obj):
+        if binding_type == DecoratorType.bean:
+            scan_results.append(BeanData.from_func(obj))
+        return scan_results
+    if binding_type == DecoratorType.component:
+        scan_results.append(ComponentData.from_cls(obj))
+    if binding_type == DecoratorType.configuration:
+        result = ConfigurationData.from_cls(obj)
+        scan_results.append(result)
+        scan_results.extend(BeanData.from_configuration(obj))
+    if binding_type == DecoratorType.configurable_component:
+        scan_results.append(ConfigurableComponentData.from_cls(obj))
+    return scan_results
+
+
+def scan_module(module: ModuleType) -> List[DecoratorData]:
+    scan_results: List[Any] = []
+    for obj in inspect.getmembers(module, inspect.isclass):
+        scan_results.extend(scan_object(obj[1]))
+    for obj in inspect.getmembers(module, inspect.isfunction):
+        scan_results.extend(scan_object(obj[1]))
+    return scan_results
+
+
+def loaded_module_files() -> Dict[str, ModuleType]:
+    modules: Dict[str, ModuleType] = {}
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if module_file:
+            modules.setdefault(os.path.abspath(module_file), module)
+    return modules
+
+
+def module_name_from_path(file_path: str) -> str:
+    abs_file_path = os.path.abspath(file_path)[:-3]
+    if os.path.basename(abs_file_path) == "__init__":
+        abs_file_path = os.path.dirname(abs_file_path)
+    roots = [
+        os.path.abspath(sys_path or os.curdir)
+        for sys_path in sys.path
+        if abs_file_path.startswith(os.path.abspath(sys_path or os.curdir) + os.sep)
+    ]
+    if not roots:
+        return file_path.replace("/", ".").replace("\\", ".")[:-3]
+    # a regular package is importable from the parent of its outermost package
+    package_root = os.path.dirname(abs_file_path)
+    while os.path.isfile(os.path.join(package_root, "__init__.py")):
+        package_root = os.path.dirname(package_root)
+    # otherwise (namespace packages) take the fully qualified name
+    root = package_root if package_root in roots else min(roots, key=len)
+    return os.path.relpath(abs_file_path, root).replace(os.sep, ".")
+
 
 def scan(
     folder_path: str,
 ) -> List[DecoratorData]:
     scan_results: List[Any] = []
+    # modules the application already imported are reused, never imported twice
+    loaded_modules = loaded_module_files()
     for root, dirs, files in os.walk(folder_path):
         for file in files:
             if file.endswith(".py"):
                 file_path = os.path.join(root, file)
-                module_path = file_path.replace("/", ".").replace("\\", ".")[:-3]
-                module = importlib.import_module(module_path)
-                for obj in inspect.getmembers(module, inspect.isclass):
-                    cls = obj[1]
-                    binding_type = getattr(cls, "__binding__", None)
-                    if binding_type is None:
-                        continue
-                    if binding_type == DecoratorType.component:
-                        scan_results.append(ComponentData.from_cls(cls))
-                    if binding_type == DecoratorType.configuration:
-                        result = ConfigurationData.from_cls(cls)
-                        scan_results.append(result)
-                        scan_results.extend(BeanData.from_configuration(cls))
-                    if binding_type == DecoratorType.configurable_component:
-                        scan_results.append(ConfigurableComponentData.from_cls(cls))
-                for obj in inspect.getmembers(module, inspect.isfunction):
-                    func = obj[1]
-                    if getattr(func, "__binding__", None) == DecoratorType.bean:
-                        scan_results.append(BeanData.from_func(func))
-        for dir in dirs:
-            scan_results.extend(scan(os.path.join(root, dir)))
+                module = loaded_modules.get(os.path.abspath(file_path))
+                if module is None:
+                    module = importlib.import_module(module_name_from_path(file_path))
+                scan_results.extend(scan_module(module))
+    return scan_results
+
+
+def scan_package(package_name: str) -> List[DecoratorData]:
+    spec = importlib.util.find_spec(package_name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {package_name!r}")
+    scan_results = scan_module(importlib.import_module(package_name))
+    if spec.submodule_search_locations is None:
+        return scan_results
+    for module_info in pkgutil.walk_packages(
+        spec.submodule_search_locations, prefix=f"{package_name}."
+    ):
+        module = importlib.import_module(module_info.name)
+        scan_results.extend(scan_module(module))
+    return scan_results
+
+
+def scan_entry_points(group: str = DEFAULT_ENTRY_POINT_GROUP) -> List[DecoratorData]:
+    from importlib.metadata import entry_points
+
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, "select"):
+        group_entry_points = all_entry_points.select(group=group)
+    else:
+        group_entry_points = all_entry_points.get(group, [])  # type: ignore
+
+    scan_results = []
+    for entry_point in group_entry_points:
+        module_name = entry_point.value.split(":")[0].strip()
+        scan_results.extend(scan_module(importlib.import_module(module_name)))
     return scan_results
 
 
@@ -57,21 +147,69 @@ def split_configurable_component_scan_results(
     return configurable_component_scan_results, other_scan_results
 
 
-def flatten_config_with_decorator_data(
+def expand_config_paths(config_paths: List[str]) -> List[str]:
+    # glob patterns expand in sorted order, so the merge order stays deterministic
+    expanded: List[str] = []
+    for config_path in config_paths:
+        if glob.has_magic(config_path):
+            matches = sorted(glob.glob(config_path, recursive=True))
+            assert matches, f"{config_path} matches no file"
+            expanded.extend(matches)
+        else:
+            expanded.append(config_path)
+    return expanded
+
+
+def parse_config_file(config_path: str) -> Tuple["ConfigTree", float]:
+    from pyhocon import ConfigFactory
+
+    assert os.path.exists(config_path), f"{config_path} not exists"
+    assert os.path.isfile(config_path), f"{config_path} is not a file"
+    assert config_path.endswith(".conf"), f"{config_path} is not a conf file"
+    start = time.perf_counter()
+    config_tree = ConfigFactory.parse_file(config_path)
+    return config_tree, time.perf_counter() - start
+
+
+def parse_config_files(
+    config_paths: List[str],
+    config_workers: Optional[int] = None,
+) -> List["ConfigTree"]:
+    config_paths = expand_config_paths(config_paths)
+    if config_workers is not None and config_workers > 1 and len(config_paths) > 1:
+        # multiprocessing is only imported when configs are parsed in parallel
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(config_workers, len(config_paths))
+        ) as executor:
+            parsed = list(executor.map(parse_config_file, config_paths))
+    else:
+        parsed = [parse_config_file(config_path) for config_path in config_paths]
+
+    for config_path, (_, seconds) in zip(config_paths, parsed):
+        logger.info("parsed %s in %.3fs", config_path, seconds)
+    # trees keep the declared order, later files override earlier keys on bind
+    return [config_tree for config_tree, _ in parsed]
+
+
+def iter_config_with_decorator_data(
     configurable_component_data_list: List[ConfigurableComponentData],
     config_paths: List[str],
-) -> List[ConfigurableComponentData]:
+    config_workers: Optional[int] = None,
+    environment: Optional[Environment] = None,
+) -> Iterator[Tuple[ConfigurableComponentData, "ConfigTree"]]:
     if not config_paths or not configurable_component_data_list:
-        return configurable_component_data_list
+        # unconfigured templates have nothing to bind
+        return
 
-    config_tree_list: List[ConfigTree] = []
-    for config_path in config_paths:
-        assert os.path.exists(config_path), f"{config_path} not exists"
-        assert os.path.isfile(config_path), f"{config_path} is not a file"
-        assert config_path.endswith(".conf"), f"{config_path} is not a conf file"
-        config_tree_list.append(ConfigFactory.parse_file(config_path))
+    # only services with config files pay for importing pyhocon
+    from pyhocon import ConfigList
+
+    if environment is None:
+        environment = Environment()
+    config_tree_list = environment.config_trees(config_paths, config_workers)
 
-    result: List[ConfigurableComponentData] = []
     for configurable_component_data in configurable_component_data_list:
         for config_tree in config_tree_list:
             candidate_or_list: Optional[Any] = None
@@ -107,43 +245,80 @@ def flatten_config_with_decorator_data(
                 # if config is list
                 if isinstance(config_or_list, list):
                     for config_item in config_or_list:
-                        _configurable_component_data = (
-                            configurable_component_data.copy()
-                        )
-                        _configurable_component_data.config = config_item
-                        result.append(_configurable_component_data)
-                else:
-                    _configurable_component_data = configurable_component_data.copy()
-                    _configurable_component_data.config = config_or_list
-                    result.append(_configurable_component_data)
-    return result
+                        if environment.accepts_config(config_item):
+                            yield configurable_component_data, config_item
+                elif environment.accepts_config(config_or_list):
+                    yield configurable_component_data, config_or_list
 
 
-def auto_scan(
+def flatten_config_with_decorator_data(
+    configurable_component_data_list: List[ConfigurableComponentData],
+    config_paths: List[str],
+    config_workers: Optional[int] = None,
+    environment: Optional[Environment] = None,
+) -> List[ConfigurableComponentData]:
+    return [
+        configurable_component_data.with_config(config)
+        for configurable_component_data, config in iter_config_with_decorator_data(
+            configurable_component_data_list,
+            config_paths,
+            config_workers,
+            environment,
+        )
+    ]
+
+
+def merge_paths(path: Optional[str], paths: Optional[List[str]]) -> List[str]:
+    _paths = []
+    if path:
+        _paths.append(path)
+    if paths:
+        _paths.extend(paths)
+    return _paths
+
+
+def scan_all(
     path: Optional[str] = None,
     paths: Optional[List[str]] = None,
-    config_path: Optional[str] = None,
-    config_paths: Optional[List[str]] = None,
+    packages: Optional[List[str]] = None,
+    entry_point_group: Optional[str] = None,
+    environment: Optional[Environment] = None,
 ) -> List[DecoratorData]:
-    _scan_paths = []
-    if path:
-        _scan_paths.append(path)
-    if paths:
-        _scan_paths.extend(paths)
-    if not _scan_paths:
+    _scan_paths = merge_paths(path, paths)
+    if not _scan_paths and not packages and entry_point_group is None:
         # use sys.path
         _scan_paths = sys.path
 
-    _config_paths = []
-    if config_path:
-        _config_paths.append(config_path)
-    if config_paths:
-        _config_paths.extend(config_paths)
-
     scan_results = []
-
     for _scan_path in _scan_paths:
         scan_results.extend(scan(_scan_path))
+    for package in packages or []:
+        scan_results.extend(scan_package(package))
+    if entry_point_group is not None:
+        scan_results.extend(scan_entry_points(entry_point_group))
+
+    if environment is None:
+        environment = Environment()
+    return [
+        scan_result
+        for scan_result in scan_results
+        if matches_conditions(scan_result, environment)
+    ]
+
+
+def auto_scan(
+    path: Optional[str] = None,
+    paths: Optional[List[str]] = None,
+    config_path: Optional[str] = None,
+    config_paths: Optional[List[str]] = None,
+    packages: Optional[List[str]] = None,
+    entry_point_group: Optional[str] = None,
+    config_workers: Optional[int] = None,
+    profiles: Optional[List[str]] = None,
+) -> List[DecoratorData]:
+    _config_paths = merge_paths(config_path, config_paths)
+    environment = Environment(profiles, _config_paths, config_workers)
+    scan_results = scan_all(path, paths, packages, entry_point_group, environment)
 
     (
         configurable_component_scan_results,
@@ -151,7 +326,10 @@ def auto_scan(
     ) = split_configurable_component_scan_results(scan_results)
 
     flattened_configurable_components = flatten_config_with_decorator_data(
-        configurable_component_scan_results, _config_paths
+        configurable_component_scan_results,
+        _config_paths,
+        config_workers,
+        environment,
     )
 
     final_results: List[DecoratorData] = other_scan_results
@@ -4,6 +4,10 @@ import enum
 class Scope(enum.Enum):
     singleton = "singleton"
     prototype = "prototype"
+    cached = "cached"
+    soft = "soft"
+    # rebuilt in background once older than its refresh interval
+    refresh = "refresh"
 
     @staticmethod
     def from_string(scope: str) -> "Scope":
@@ -11,3 +15,10 @@ class Scope(enum.Enum):
             if item.value == scope:
                 return item
         raise ValueError(f"Scope {scope} is not supported")
+
+
+class InitMode(enum.Enum):
+    # build on first resolution
+    lazy = "lazy"
+    # start building on the container executor right after binding
+    background = "background"
@@ -0,0 +1,167 @@
+import mmap
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from pyspring.auto import SoftHolder
+
+
+def current_memory() -> Optional[int]:
+    """Traced bytes while tracemalloc is running, otherwise the process RSS."""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * mmap.PAGESIZE
+
+
+class PartitionKey(NamedTuple):
+    """Registry key of a soft singleton bound in a partition.
+
+    Partitions share the container registry and usually bind the same keys.
+    """
+
+    partition: str
+    key: Any
+
+
+class SoftStats:
+    builds: int
+    rebuilds: int
+    evictions: int
+
+    def __init__(self, builds: int = 0, rebuilds: int = 0, evictions: int = 0) -> None:
+        self.builds = builds
+        self.rebuilds = rebuilds
+        self.evictions = evictions
+
+    def __repr__(self) -> str:
+        return (
+            f"SoftStats(builds={self.builds}, rebuilds={self.rebuilds}, "
+            + f"evictions={self.evictions})"
+        )
+
+
+class SoftRegistry:
+    """Container-wide bookkeeping of the singletons bound with ``Scope.soft``.
+
+    A soft singleton is dropped once it has not been resolved for ``idle_ttl``
+    seconds, or, least recently used first, while ``current_memory()`` exceeds
+    ``memory_budget`` bytes. It is rebuilt on its next resolution. Checks run
+    after every build and at most every ``check_interval`` seconds on access;
+    ``collect()`` can also be called directly. Freed memory rarely shows in the
+    RSS right away, so a check evicts at most ``max_evictions`` singletons for
+    the budget instead of all of them.
+    """
+
+    idle_ttl: Optional[float]
+    memory_budget: Optional[int]
+    check_interval: float
+    max_evictions: int
+    measure: Callable[[], Optional[int]]
+
+    # binding key (PartitionKey in partitions) -> holder, least recently used first
+    holders: "OrderedDict[Any, SoftHolder]"
+    last_check: float
+
+    def __init__(
+        self,
+        idle_ttl: Optional[float] = None,
+        memory_budget: Optional[int] = None,
+        check_interval: float = 1.0,
+        measure: Callable[[], Optional[int]] = current_memory,
+        max_evictions: int = 1,
+    ) -> None:
+        self.idle_ttl = idle_ttl
+        self.memory_budget = memory_budget
+        self.check_interval = check_interval
+        self.max_evictions = max_evictions
+        self.measure = measure
+        self.holders = OrderedDict()
+        self.last_check = time.monotonic()
+        self.lock = threading.RLock()
+
+    def register(self, binding_key: Any, holder: "SoftHolder") -> None:
+        with self.lock:
+            self.holders[binding_key] = holder
+            holder.binding_key = binding_key
+
+    def unregister(self, binding_key: Any) -> None:
+        with self.lock:
+            holder = self.holders.pop(binding_key, None)
+            if holder is not None:
+                holder.evict()
+
+    def unregister_partition(self, partition: str) -> None:
+        with self.lock:
+            for registry_key in list(self.holders):
+                if (
+                    isinstance(registry_key, PartitionKey)
+                    and registry_key.partition == partition
+                ):
+                    self.unregister(registry_key)
+
+    def touch(self, holder: "SoftHolder") -> None:
+        now = time.monotonic()
+        holder.last_used = now
+        with self.lock:
+            if holder.binding_key in self.holders:
+                self.holders.move_to_end(holder.binding_key)
+        if now - self.last_check >= self.check_interval:
+            self.collect()
+
+    def over_budget(self) -> bool:
+        if self.memory_budget is None:
+            return False
+        usage = self.measure()
+        return usage is not None and usage > self.memory_budget
+
+    def collect(self, keep: Optional["SoftHolder"] = None) -> int:
+        evicted = 0
+        with self.lock:
+            now = time.monotonic()
+            self.last_check = now
+            if self.idle_ttl is not None:
+                for holder in list(self.holders.values()):
+                    if holder.built() and now - holder.last_used >= self.idle_ttl:
+                        evicted += holder.evict()
+            if self.over_budget():
+                budget_evicted = 0
+                for holder in list(self.holders.values()):
+                    if holder.built() and holder is not keep:
+                        budget_evicted += holder.evict()
+                        if (
+                            budget_evicted >= self.max_evictions
+                            or not self.over_budget()
+                        ):
+                            break
+                evicted += budget_evicted
+        return evicted
+
+    def evict(self, binding_key: Optional[Any] = None) -> int:
+        with self.lock:
+            if binding_key is not None:
+                holder = self.holders.get(binding_key)
+                if holder is None:
+                    raise KeyError(f"{binding_key} is not bound with Scope.soft")
+                return holder.evict()
+            return sum(holder.evict() for holder in list(self.holders.values()))
+
+    def stats(self, binding_key: Optional[Any] = None) -> SoftStats:
+        if binding_key is not None:
+            holder = self.holders.get(binding_key)
+            if holder is None:
+                raise KeyError(f"{binding_key} is not bound with Scope.soft")
+            return holder.stats
+        total = SoftStats()
+        for holder in list(self.holders.values()):
+            total.builds += holder.stats.builds
+            total.rebuilds += holder.stats.rebuilds
+            total.evictions += holder.stats.evictions
+        return total
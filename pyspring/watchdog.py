@@ -0,0 +1,263 @@
+import contextvars
+import logging
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from inject import InjectorException
+
+from pyspring.locks import InitLock, waiting_for
+
+logger = logging.getLogger("pyspring")
+
+
+class InitTimeoutError(InjectorException):
+    pass
+
+
+class InitBudget:
+    """Construction time budget of a bean, in seconds.
+
+    Past ``soft`` the watchdog logs the stack of the building thread, past
+    ``hard`` the resolution fails with ``InitTimeoutError``.
+    """
+
+    soft: Optional[float]
+    hard: Optional[float]
+
+    def __init__(self, soft: Optional[float] = None, hard: Optional[float] = None):
+        self.soft = soft
+        self.hard = hard
+
+    @staticmethod
+    def of(value: Any) -> Optional["InitBudget"]:
+        """Budget from a decorator arg or HOCON value: a hard limit or {soft, hard}."""
+        if value is None or isinstance(value, InitBudget):
+            return value
+        if isinstance(value, (int, float)):
+            return InitBudget(hard=float(value))
+        soft = value.get("soft", None)
+        hard = value.get("hard", None)
+        return InitBudget(
+            soft=float(soft) if soft is not None else None,
+            hard=float(hard) if hard is not None else None,
+        )
+
+    def __repr__(self) -> str:
+        return f"InitBudget(soft={self.soft}, hard={self.hard})"
+
+
+# decorator arg: a hard budget in seconds, or an InitBudget
+InitTimeout = Union[None, float, InitBudget]
+
+
+class InitBuild:
+    __slots__ = ("key", "soft", "hard", "ident", "started", "warned")
+
+    key: Any
+    soft: Optional[float]
+    hard: Optional[float]
+    ident: int
+    started: float
+    warned: bool
+
+    def __init__(
+        self, key: Any, soft: Optional[float], hard: Optional[float], ident: int
+    ) -> None:
+        self.key = key
+        self.soft = soft
+        self.hard = hard
+        self.ident = ident
+        self.started = time.monotonic()
+        self.warned = False
+
+
+class InitWatchdog:
+    """Times bean construction and enforces construction budgets.
+
+    ``soft`` / ``hard`` are the default budgets of every bean; beans with an
+    ``init_timeout`` of their own override them. A daemon thread checks the
+    running builds every ``check_interval`` seconds. Builds with a hard budget
+    run on a thread of their own while the resolving thread waits at most
+    ``hard`` seconds, so calls blocked in C are cut short too; the abandoned
+    build finishes in the background. ``summary()`` lists the slowest builds
+    seen so far.
+    """
+
+    soft: Optional[float]
+    hard: Optional[float]
+    check_interval: float
+    builds: List[InitBuild]
+    timings: Dict[Any, float]
+
+    def __init__(
+        self,
+        soft: Optional[float] = None,
+        hard: Optional[float] = None,
+        check_interval: float = 0.1,
+    ) -> None:
+        self.soft = soft
+        self.hard = hard
+        self.check_interval = check_interval
+        self.builds = []
+        self.timings = {}
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def enabled(self, budget: Optional[InitBudget]) -> bool:
+        return budget is not None or self.soft is not None or self.hard is not None
+
+    def run(
+        self,
+        key: Any,
+        budget: Optional[InitBudget],
+        init_func: Callable[..., Any],
+        args: Any,
+        kwargs: Any,
+    ) -> Any:
+        soft, hard = self.soft, self.hard
+        if budget is not None:
+            soft = budget.soft if budget.soft is not None else soft
+            hard = budget.hard if budget.hard is not None else hard
+        if hard is None:
+            build = InitBuild(key, soft, hard, threading.get_ident())
+            self.track(build)
+            try:
+                return init_func(*args, **kwargs)
+            finally:
+                self.finish(build)
+        return self.run_bounded(key, soft, hard, init_func, args, kwargs)
+
+    def run_bounded(
+        self,
+        key: Any,
+        soft: Optional[float],
+        hard: float,
+        init_func: Callable[..., Any],
+        args: Any,
+        kwargs: Any,
+    ) -> Any:
+        future: "Future[Any]" = Future()
+        build = InitBuild(key, soft, hard, 0)
+        # held by the build thread, the resolving thread is recorded as waiting
+        # on it, so a build resolving back into the chain raises DeadlockError
+        build_lock = InitLock(key)
+        context = contextvars.copy_context()
+
+        def build_product() -> None:
+            with build_lock:
+                build.ident = threading.get_ident()
+                self.track(build)
+                try:
+                    future.set_result(context.run(init_func, *args, **kwargs))
+                except BaseException as error:
+                    future.set_exception(error)
+                finally:
+                    self.finish(build)
+
+        thread = threading.Thread(
+            target=build_product, name=f"pyspring-init-{key}", daemon=True
+        )
+        with waiting_for(build_lock):
+            thread.start()
+            try:
+                return future.result(timeout=hard)
+            except FutureTimeoutError:
+                logger.error(
+                    "%r exceeded its hard init budget of %ss, abandoning the build",
+                    key,
+                    hard,
+                )
+                raise InitTimeoutError(
+                    f"{key!r} did not initialize within its hard budget of {hard}s"
+                ) from None
+
+    def track(self, build: InitBuild) -> None:
+        with self.lock:
+            self.builds.append(build)
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.watch, name="pyspring-watchdog", daemon=True
+                )
+                self.thread.start()
+
+    def finish(self, build: InitBuild) -> None:
+        with self.lock:
+            self.builds.remove(build)
+            seconds = time.monotonic() - build.started
+            if seconds > self.timings.get(build.key, -1.0):
+                self.timings[build.key] = seconds
+
+    def watch(self) -> None:
+        while True:
+            time.sleep(self.check_interval)
+            self.check()
+
+    def check(self) -> None:
+        now = time.monotonic()
+        with self.lock:
+            for build in self.builds:
+                elapsed = now - build.started
+                if not build.warned and build.soft is not None and elapsed > build.soft:
+                    build.warned = True
+                    logger.warning(
+                        "%r still initializing after %.1fs (soft budget %ss):\n%s",
+                        build.key,
+                        elapsed,
+                        build.soft,
+                        self.format_stack(build.ident),
+                    )
+
+    @staticmethod
+    def format_stack(ident: int) -> str:
+        frame = sys._current_frames().get(ident)
+        if frame is None:
+            return "  <thread exited>"
+        return "".join(traceback.format_stack(frame))
+
+    def summary(self, limit: Optional[int] = 10) -> List[Tuple[Any, float]]:
+        with self.lock:
+            timings = sorted(self.timings.items(), key=lambda item: -item[1])
+        return timings[:limit] if limit is not None else timings
+
+    def log_summary(self, limit: Optional[int] = 10) -> None:
+        timings = self.summary(limit)
+        if not timings:
+            return
+        logger.info(
+            "slowest beans:\n%s",
+            "\n".join(f"  {seconds:8.3f}s  {key!r}" for key, seconds in timings),
+        )
+
+
+class WatchedInitFunc:
+    """Wraps an init func, timing each call on the container's watchdog."""
+
+    __slots__ = ("init_func", "key", "watchdog", "budget")
+
+    init_func: Callable[..., Any]
+    key: Any
+    watchdog: InitWatchdog
+    budget: Optional[InitBudget]
+
+    def __init__(
+        self,
+        init_func: Callable[..., Any],
+        key: Any,
+        watchdog: InitWatchdog,
+        budget: Optional[InitBudget] = None,
+    ) -> None:
+        self.init_func = init_func
+        self.key = key
+        self.watchdog = watchdog
+        self.budget = budget
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.watchdog.run(self.key, self.budget, self.init_func, args, kwargs)
+
+    def __repr__(self) -> str:
+        return f"<watched {self.init_func!r}>"